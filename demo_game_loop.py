@@ -237,8 +237,9 @@ def create_demo_game():
         # Show state at start of MAIN phase
         # Manually advance to MAIN phase for demo
         game.state.current_phase = Phase.MAIN
-        game.state.active_don = 2 + game.turn_count  # Give some DON!! to play with
-        game.state.don_pool = 2 + game.turn_count
+        active_player = game.state.get_active_player()
+        active_player.active_don = 2 + game.turn_count  # Give some DON!! to play with
+        active_player.don_pool = 2 + game.turn_count
         
         print_game_state(game, f"Turn {turn + 1} - MAIN Phase")
         
@@ -12,8 +12,8 @@ For One Piece TCG, we evaluate:
 - Card quality (power levels)
 """
 
-from typing import Dict, Any
-from src.engine.game_state import GameState, PlayerState
+from typing import Optional, Tuple
+from src.engine.game_state import CardState, GameState, PlayerState
 
 
 class BoardEvaluator:
@@ -28,7 +28,9 @@ class BoardEvaluator:
     Similar to chess evaluation: +5 means "I'm winning by 5 pawns worth"
     """
     
-    # Weights for different aspects (tuned through testing)
+    # Weights for different aspects (tuned through testing).
+    # evaluate() applies them with plain scalar arithmetic: for a handful
+    # of features, building NumPy arrays per call costs more than the sum.
     WEIGHT_LIFE_CARD = 1000        # Life is critical!
     WEIGHT_CHARACTER = 100          # Board presence matters
     WEIGHT_CHARACTER_POWER = 0.01   # Quality of characters
@@ -57,104 +59,60 @@ class BoardEvaluator:
             my_state = game_state.player2
             opp_state = game_state.player1
         
-        # Start with zero score
-        score = 0.0
+        my_life, my_chars, my_power, my_don, my_hand, my_deck, my_rested = (
+            cls._player_features(my_state)
+        )
+        opp_life, opp_chars, opp_power, opp_don, opp_hand, opp_deck, opp_rested = (
+            cls._player_features(opp_state)
+        )
         
         # 1. Life cards (most critical)
-        score += cls._evaluate_life(my_state, opp_state)
-        
-        # 2. Board presence
-        score += cls._evaluate_board(my_state, opp_state)
-        
-        # 3. Resources (DON!!)
-        score += cls._evaluate_resources(my_state, opp_state)
-        
-        # 4. Card advantage
-        score += cls._evaluate_cards(my_state, opp_state)
-        
-        # 5. Leader state
-        score += cls._evaluate_leader(my_state, opp_state, game_state)
-        
-        return score
-    
-    @classmethod
-    def _evaluate_life(cls, my_state: PlayerState, opp_state: PlayerState) -> float:
-        """Evaluate life card advantage (most important factor)."""
-        my_life = len(my_state.life_cards)
-        opp_life = len(opp_state.life_cards)
-        
-        # Life difference
-        life_diff = (my_life - opp_life) * cls.WEIGHT_LIFE_CARD
-        
-        # Bonus for having more life
-        # Penalty if we're low on life (danger zone!)
+        score = float((my_life - opp_life) * cls.WEIGHT_LIFE_CARD)
+        # Penalty if we're low on life (danger zone!), bonus if they are
         if my_life <= 1:
-            life_diff -= 500  # Critical danger!
+            score -= 500
         if opp_life <= 1:
-            life_diff += 500  # Opponent in danger!
+            score += 500
         
-        return life_diff
-    
-    @classmethod
-    def _evaluate_board(cls, my_state: PlayerState, opp_state: PlayerState) -> float:
-        """Evaluate board presence (characters on field)."""
-        score = 0.0
-        
-        # Number of characters
-        my_chars = len(my_state.characters)
-        opp_chars = len(opp_state.characters)
+        # 2. Board presence: number of characters and total power
         score += (my_chars - opp_chars) * cls.WEIGHT_CHARACTER
-        
-        # Total power on board
-        my_power = sum(char.power for char in my_state.characters)
-        opp_power = sum(char.power for char in opp_state.characters)
         score += (my_power - opp_power) * cls.WEIGHT_CHARACTER_POWER
         
-        return score
-    
-    @classmethod
-    def _evaluate_resources(cls, my_state: PlayerState, opp_state: PlayerState) -> float:
-        """Evaluate DON!! resources."""
-        # DON!! pool size (total available)
-        my_don = my_state.don_pool
-        opp_don = opp_state.don_pool
-        
-        return (my_don - opp_don) * cls.WEIGHT_DON_POOL
-    
-    @classmethod
-    def _evaluate_cards(cls, my_state: PlayerState, opp_state: PlayerState) -> float:
-        """Evaluate card advantage (hand and deck)."""
-        score = 0.0
+        # 3. Resources (DON!! pool size)
+        score += (my_don - opp_don) * cls.WEIGHT_DON_POOL
         
-        # Hand size
-        my_hand = len(my_state.hand)
-        opp_hand = len(opp_state.hand)
+        # 4. Card advantage (hand size and deck-out risk)
         score += (my_hand - opp_hand) * cls.WEIGHT_HAND_SIZE
-        
-        # Deck size (deck-out risk)
-        my_deck = len(my_state.deck)
-        opp_deck = len(opp_state.deck)
         score += (my_deck - opp_deck) * cls.WEIGHT_DECK_SIZE
         
-        return score
-    
-    @classmethod
-    def _evaluate_leader(cls, my_state: PlayerState, opp_state: PlayerState, game_state: GameState) -> float:
-        """Evaluate leader state (active vs rested)."""
-        from src.engine.game_state import CardState
-        
-        score = 0.0
-        
-        # Penalty if our leader is rested (vulnerable)
-        if my_state.leader_state == CardState.RESTED:
+        # 5. Leader state (a rested leader is vulnerable)
+        if my_rested:
             score += cls.WEIGHT_LEADER_RESTED
-        
-        # Bonus if opponent's leader is rested
-        if opp_state.leader_state == CardState.RESTED:
+        if opp_rested:
             score -= cls.WEIGHT_LEADER_RESTED
         
         return score
     
+    @staticmethod
+    def _player_features(state: PlayerState) -> Tuple[int, int, int, int, int, int, bool]:
+        """
+        Read the values the evaluation uses from one player's state.
+        
+        Returns:
+            (life, characters, character power, DON!! pool, hand size,
+            deck size, leader rested)
+        """
+        characters = state.characters
+        return (
+            len(state.life_cards),
+            len(characters),
+            sum([char.power for char in characters]),
+            state.don_pool,
+            len(state.hand),
+            len(state.deck),
+            state.leader_state is CardState.RESTED,
+        )
+    
     @classmethod
     def is_terminal_state(cls, game_state: GameState) -> bool:
         """
@@ -177,8 +135,22 @@ class BoardEvaluator:
         Returns:
             Large positive score if player won, large negative if lost
         """
-        winner = game_state.get_winner()
+        return cls.score_winner(game_state.get_winner(), player_id)
+    
+    @classmethod
+    def score_winner(cls, winner: Optional[PlayerState], player_id: str) -> float:
+        """
+        Score a game result given its winner.
         
+        Lets callers that already called get_winner() skip a second check.
+        
+        Args:
+            winner: Winning player, or None for a draw
+            player_id: Player to evaluate for
+            
+        Returns:
+            Large positive score if player won, large negative if lost
+        """
         if winner is None:
             return 0.0  # Draw
         
@@ -12,14 +12,27 @@ Alpha-Beta Pruning cuts search time significantly by skipping
 branches that can't possibly be better than what we've already found.
 """
 
-import copy
-from typing import Optional, List
+from collections import OrderedDict
+from typing import Optional, List, Tuple
 from src.engine.game_state import GameState, Phase, CardState
-from src.engine.actions import Action, PassPhaseAction, ActionType
+from src.engine.actions import (
+    Action, ActionType, AttachDonAction, AttackAction, PassPhaseAction, PlayCardAction,
+)
+from src.engine.abilities import get_counter_value, has_blocker
+from src.engine.battle import initiate_battle, resolve_battle, BattlePhase
 from src.engine.rules import get_legal_actions
+from src.models import Character, Event
 from src.ai.evaluator import BoardEvaluator
 
 
+# Maximum transposition table entries (least recently used evicted)
+_TT_SIZE = 100_000
+
+# Transposition table entry kinds: the stored score is exact, or only a
+# lower/upper bound because alpha-beta cut the search short
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
 class MinimaxAI:
     """
     Strategic AI using Minimax algorithm with alpha-beta pruning.
@@ -56,6 +69,12 @@ class MinimaxAI:
         # Statistics for analysis
         self.nodes_evaluated = 0
         self.nodes_pruned = 0
+        self.tt_hits = 0
+        
+        # Transposition table: (position key, depth, is_maximizing) ->
+        # (score, entry kind). The same position is often reached by
+        # playing the same actions in a different order.
+        self._tt: "OrderedDict[tuple, Tuple[float, int]]" = OrderedDict()
     
     def get_action(self, game_state: GameState) -> Optional[Action]:
         """
@@ -73,19 +92,17 @@ class MinimaxAI:
         # Reset statistics
         self.nodes_evaluated = 0
         self.nodes_pruned = 0
+        self.tt_hits = 0
+        
+        # Position keys are only comparable within one search
+        self._tt.clear()
         
         # Only make decisions during MAIN phase
-        if game_state.current_phase != Phase.MAIN:
+        if game_state.current_phase is not Phase.MAIN:
             return None
         
-        # Get all legal moves
-        legal_actions = get_legal_actions(game_state, self.player_id)
-        
-        # Filter out pass actions (we'll add it back if needed)
-        non_pass_actions = [
-            action for action in legal_actions
-            if action.action_type != ActionType.PASS_PHASE
-        ]
+        # Get all legal moves except passing (we'll add it back if needed)
+        non_pass_actions = get_legal_actions(game_state, self.player_id, include_pass=False)
         
         # If no actions available, must pass
         if not non_pass_actions:
@@ -172,8 +189,11 @@ class MinimaxAI:
         self.nodes_evaluated += 1
         
         # Base cases: terminal state or max depth reached
-        if self.evaluator.is_terminal_state(game_state):
-            return self.evaluator.get_terminal_score(game_state, self.player_id)
+        # (every game-over state has a winner, so one get_winner() call
+        # both detects and scores it)
+        winner = game_state.get_winner()
+        if winner is not None:
+            return self.evaluator.score_winner(winner, self.player_id)
         
         if depth >= self.max_depth:
             return self.evaluator.evaluate(game_state, self.player_id)
@@ -181,19 +201,70 @@ class MinimaxAI:
         # Get current player
         current_player_id = game_state.active_player_id
         
-        # Get legal actions for current player
-        legal_actions = get_legal_actions(game_state, current_player_id)
-        
-        # Filter out pass actions for now (simplified)
-        non_pass_actions = [
-            action for action in legal_actions
-            if action.action_type != ActionType.PASS_PHASE
-        ]
+        # Get legal actions for current player, leaving out passing
+        # for now (simplified)
+        non_pass_actions = get_legal_actions(game_state, current_player_id, include_pass=False)
         
         # If no actions, evaluate current position
         if not non_pass_actions:
             return self.evaluator.evaluate(game_state, self.player_id)
         
+        # Reuse the result of searching this position before, if it is
+        # exact or its bound already settles this node
+        tt_key = (game_state.canonical_key(), depth, is_maximizing)
+        entry = self._tt.get(tt_key)
+        if entry is not None:
+            score, kind = entry
+            if kind == _LOWER:
+                alpha = max(alpha, score)
+            elif kind == _UPPER:
+                beta = min(beta, score)
+            if kind == _EXACT or beta <= alpha:
+                self.tt_hits += 1
+                self._tt.move_to_end(tt_key)
+                return score
+        alpha_orig, beta_orig = alpha, beta
+        
+        score = self._search_children(
+            game_state, non_pass_actions, depth, is_maximizing, alpha, beta
+        )
+        
+        # A score at or outside the window only bounds the true value
+        if score <= alpha_orig:
+            kind = _UPPER
+        elif score >= beta_orig:
+            kind = _LOWER
+        else:
+            kind = _EXACT
+        self._tt[tt_key] = (score, kind)
+        self._tt.move_to_end(tt_key)
+        if len(self._tt) > _TT_SIZE:
+            self._tt.popitem(last=False)
+        return score
+    
+    def _search_children(
+        self,
+        game_state: GameState,
+        non_pass_actions: List[Action],
+        depth: int,
+        is_maximizing: bool,
+        alpha: float,
+        beta: float
+    ) -> float:
+        """
+        Search each action's resulting position and combine the scores.
+        
+        Args:
+            game_state: Current game state
+            non_pass_actions: Actions to try from this position
+            depth: Current search depth
+            is_maximizing: True if maximizing player's turn, False if minimizing
+            alpha: Alpha value for pruning (best for maximizer)
+            beta: Beta value for pruning (best for minimizer)
+            
+        Returns:
+            Best score for the player to move
+        """
         # Limit branching factor (explore top N moves to keep performance reasonable)
         MAX_ACTIONS_PER_LEVEL = 5
         if len(non_pass_actions) > MAX_ACTIONS_PER_LEVEL:
@@ -261,7 +332,7 @@ class MinimaxAI:
         """
         Simulate taking an action and return the resulting game state.
         
-        This creates a deep copy of the game state and applies the action.
+        This clones the game state and applies the action to the clone.
         
         Args:
             game_state: Current game state
@@ -270,22 +341,17 @@ class MinimaxAI:
         Returns:
             New game state after action, or None if action invalid
         """
-        # Create deep copy of game state
+        simulate = self._SIMULATORS.get(action.action_type)
+        if simulate is None:
+            # Unsupported action type - don't bother copying the state
+            return None
+        
+        # Clone the game state (cards are shared, zones are copied)
         try:
-            new_state = copy.deepcopy(game_state)
+            new_state = game_state.clone()
             
             # Apply action based on type
-            if action.action_type == ActionType.PLAY_CARD:
-                success = self._simulate_play_card(new_state, action)
-            elif action.action_type == ActionType.ATTACK:
-                success = self._simulate_attack(new_state, action)
-            elif action.action_type == ActionType.ATTACH_DON:
-                success = self._simulate_attach_don(new_state, action)
-            elif action.action_type == ActionType.PASS_PHASE:
-                success = self._simulate_pass_phase(new_state, action)
-            else:
-                # Unsupported action type
-                return None
+            success = simulate(self, new_state, action)
             
             return new_state if success else None
             
@@ -295,32 +361,30 @@ class MinimaxAI:
     
     def _simulate_play_card(self, game_state: GameState, action: Action) -> bool:
         """Simulate playing a card."""
-        from src.engine.actions import PlayCardAction
-        from src.models import Character, Event
-        
         if not isinstance(action, PlayCardAction):
             return False
         
         current_player = game_state.get_active_player()
         card = action.card
         
+        # Check the DON!! cost before touching the hand
+        cost = action.don_to_rest
+        if current_player.active_don < cost:
+            return False
+        
         # Remove from hand
-        if card not in current_player.hand:
+        try:
+            current_player.hand.remove(card)
+        except ValueError:
             return False
-        current_player.hand.remove(card)
         
         # Pay DON!! cost
-        cost = action.don_to_rest
-        if current_player.active_don < cost:
-            current_player.hand.append(card)
-            return False
         current_player.active_don -= cost
         
         # Add to appropriate zone
         if isinstance(card, Character):
-            current_player.characters.append(card)
+            current_player.add_character(card)
             current_player.played_this_turn.add(card.id)
-            current_player.character_states[card.id] = CardState.ACTIVE
         elif isinstance(card, Event):
             current_player.trash.append(card)
         
@@ -333,9 +397,6 @@ class MinimaxAI:
         For simulation purposes, we use simplified battle resolution without
         interactive defender choices (no blockers or counters).
         """
-        from src.engine.actions import AttackAction
-        from src.engine.battle import initiate_battle, resolve_battle, BattlePhase
-        
         if not isinstance(action, AttackAction):
             return False
         
@@ -365,8 +426,6 @@ class MinimaxAI:
     
     def _simulate_attach_don(self, game_state: GameState, action: Action) -> bool:
         """Simulate attaching DON!!."""
-        from src.engine.actions import AttachDonAction
-        
         if not isinstance(action, AttachDonAction):
             return False
         
@@ -377,11 +436,7 @@ class MinimaxAI:
             return False
         
         # Move DON!!
-        current_player.active_don -= action.don_count
-        
-        if action.target_id not in current_player.attached_don:
-            current_player.attached_don[action.target_id] = 0
-        current_player.attached_don[action.target_id] += action.don_count
+        current_player.attach_don(action.target_id, action.don_count)
         
         return True
     
@@ -391,6 +446,14 @@ class MinimaxAI:
         game_state.advance_phase()
         return True
     
+    # _simulate_action() dispatch table: action type -> simulator
+    _SIMULATORS = {
+        ActionType.PLAY_CARD: _simulate_play_card,
+        ActionType.ATTACK: _simulate_attack,
+        ActionType.ATTACH_DON: _simulate_attach_don,
+        ActionType.PASS_PHASE: _simulate_pass_phase,
+    }
+    
     def get_defensive_blocker(self, game_state: GameState, battle) -> Optional[str]:
         """
         Choose a blocker during opponent's attack.
@@ -406,15 +469,12 @@ class MinimaxAI:
         """
         # TODO: Use minimax to evaluate blocking vs not blocking
         # For now, simple heuristic: block if we have a low-power blocker
-        from src.engine.game_state import CardState
-        from src.engine.abilities import has_blocker
-        
         player = game_state.player1 if game_state.player1.player_id == self.player_id else game_state.player2
         
         # Find available blockers
         available_blockers = []
         for char in player.characters:
-            if player.character_states.get(char.id, CardState.ACTIVE) == CardState.ACTIVE:
+            if player.character_states.get(char.id, CardState.ACTIVE) is CardState.ACTIVE:
                 if has_blocker(char):
                     available_blockers.append(char)
         
@@ -440,9 +500,6 @@ class MinimaxAI:
         """
         # TODO: Use minimax to evaluate counter value
         # For now, simple heuristic: use one counter if available
-        from src.models import Event
-        from src.engine.abilities import get_counter_value
-        
         player = game_state.player1 if game_state.player1.player_id == self.player_id else game_state.player2
         
         # Find counter cards
@@ -461,6 +518,8 @@ class MinimaxAI:
         """Reset AI statistics."""
         self.nodes_evaluated = 0
         self.nodes_pruned = 0
+        self.tt_hits = 0
+        self._tt.clear()
     
     def __repr__(self):
         return f"MinimaxAI(player={self.player_id}, depth={self.max_depth}, alpha_beta={self.use_alpha_beta})"
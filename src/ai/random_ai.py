@@ -22,6 +22,10 @@ if TYPE_CHECKING:
     from src.engine.battle import Battle
 
 
+# Action counts per turn with a precomputed chance to act (see get_action)
+_ACT_CHANCE_TABLE_SIZE = 16
+
+
 class RandomAI:
     """
     AI player that chooses random legal actions.
@@ -38,7 +42,8 @@ class RandomAI:
     This creates somewhat realistic gameplay while remaining unpredictable.
     """
     
-    def __init__(self, player_id: str, action_probability: float = 0.7):
+    def __init__(self, player_id: str, action_probability: float = 0.7,
+                 seed: Optional[int] = None):
         """
         Initialize the Random AI.
         
@@ -46,12 +51,26 @@ class RandomAI:
             player_id: The player ID this AI controls ("1" or "2")
             action_probability: Chance of taking an action vs passing (0.0-1.0)
                                Higher values make AI more aggressive
+            seed: Seed for a private random generator, making this AI's
+                  choices reproducible. None uses the shared random module.
         """
         self.player_id = player_id
         self.action_probability = action_probability
+        self._rng = random if seed is None else random.Random(seed)
         self.actions_this_turn = 0
         self.name = f"RandomAI-{player_id}"
     
+    @property
+    def action_probability(self) -> float:
+        """Chance of taking an action vs passing, before any actions this turn."""
+        return self._action_probability
+    
+    @action_probability.setter
+    def action_probability(self, value: float) -> None:
+        self._action_probability = value
+        # Chance to act after n actions this turn, for small n
+        self._act_chances = [value / (1 + n * 0.2) for n in range(_ACT_CHANCE_TABLE_SIZE)]
+    
     def get_action(self, game_state: GameState) -> Optional[Action]:
         """
         Choose a random action from legal moves.
@@ -69,21 +88,16 @@ class RandomAI:
             A random legal action, or None/PassPhaseAction to pass
         """
         # Reset turn counter when phase changes back to REFRESH
-        if game_state.current_phase == Phase.REFRESH:
+        if game_state.current_phase is Phase.REFRESH:
             self.actions_this_turn = 0
         
         # Only make decisions during MAIN phase (other phases auto-advance)
-        if game_state.current_phase != Phase.MAIN:
+        if game_state.current_phase is not Phase.MAIN:
             return None
         
-        # Get all legal moves available (like chess move generation)
-        legal_actions = get_legal_actions(game_state, self.player_id)
-        
-        # Filter out pass actions from the legal moves list
-        non_pass_actions = [
-            action for action in legal_actions 
-            if action.action_type != ActionType.PASS_PHASE
-        ]
+        # Get all legal moves available (like chess move generation),
+        # leaving out passing - we decide separately when to pass
+        non_pass_actions = get_legal_actions(game_state, self.player_id, include_pass=False)
         
         # If no actions available, must pass
         if not non_pass_actions:
@@ -95,7 +109,12 @@ class RandomAI:
         # Decide whether to take an action or pass this turn
         # Use action_probability to create realistic play patterns
         # After taking several actions, increase chance of passing
-        should_act = random.random() < (self.action_probability / (1 + self.actions_this_turn * 0.2))
+        n = self.actions_this_turn
+        if n < _ACT_CHANCE_TABLE_SIZE:
+            act_chance = self._act_chances[n]
+        else:
+            act_chance = self._action_probability / (1 + n * 0.2)
+        should_act = self._rng.random() < act_chance
         
         if not should_act:
             # Randomly decided to pass
@@ -105,7 +124,7 @@ class RandomAI:
             )
         
         # Choose a random action from available moves
-        chosen_action = random.choice(non_pass_actions)
+        chosen_action = self._rng.choice(non_pass_actions)
         self.actions_this_turn += 1
         
         return chosen_action
@@ -135,7 +154,7 @@ class RandomAI:
         available_blockers = []
         for char in player.characters:
             # Must be active (not rested)
-            if player.character_states.get(char.id, CardState.ACTIVE) == CardState.ACTIVE:
+            if player.character_states.get(char.id, CardState.ACTIVE) is CardState.ACTIVE:
                 # Must have [Blocker] ability
                 if has_blocker(char):
                     available_blockers.append(char)
@@ -146,9 +165,9 @@ class RandomAI:
         
         # Randomly decide whether to block (50% chance)
         # More sophisticated AIs would evaluate if blocking is beneficial
-        if random.random() < 0.5:
+        if self._rng.random() < 0.5:
             # Choose a random blocker
-            blocker = random.choice(available_blockers)
+            blocker = self._rng.choice(available_blockers)
             return blocker.id
         
         return None
@@ -184,10 +203,10 @@ class RandomAI:
         
         # Randomly decide whether to counter (50% chance)
         # Could play 0, 1, or multiple counters
-        if random.random() < 0.5:
+        if self._rng.random() < 0.5:
             # Randomly choose how many counters to play (1-3)
-            num_counters = random.randint(1, min(3, len(available_counters)))
-            counters = random.sample(available_counters, num_counters)
+            num_counters = self._rng.randint(1, min(3, len(available_counters)))
+            counters = self._rng.sample(available_counters, num_counters)
             return counters
         
         return []
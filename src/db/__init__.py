@@ -4,6 +4,7 @@ Database operations package for TCG Deckhand.
 This package provides:
 - schema: Database table definitions and version tracking
 - connection: Connection management utilities
+- query_cache: Result cache for read-only card queries
 - card_operations: CRUD operations for cards
 - deck_operations: CRUD operations for decks
 """
@@ -15,9 +16,18 @@ from .schema import (
     DEFAULT_DB_PATH,
     CURRENT_SCHEMA_VERSION,
 )
-from .connection import get_connection, get_connection_context, verify_connection
+from .connection import (
+    get_connection,
+    get_connection_context,
+    get_closing_connection_context,
+    transaction,
+    close_all,
+    verify_connection,
+)
+from .query_cache import clear_query_cache
 from .card_operations import (
     save_card,
+    save_cards,
     get_card_by_id,
     get_card_by_name,
     get_all_cards,
@@ -31,6 +41,7 @@ from .deck_operations import (
     get_deck_by_id,
     get_deck_by_name,
     get_all_decks,
+    get_all_decks_with_counts,
     get_deck_card_count,
     delete_deck,
     search_decks,
@@ -47,9 +58,15 @@ __all__ = [
     # Connection
     "get_connection",
     "get_connection_context",
+    "get_closing_connection_context",
+    "transaction",
+    "close_all",
     "verify_connection",
+    # Query cache
+    "clear_query_cache",
     # Card operations
     "save_card",
+    "save_cards",
     "get_card_by_id",
     "get_card_by_name",
     "get_all_cards",
@@ -62,6 +79,7 @@ __all__ = [
     "get_deck_by_id",
     "get_deck_by_name",
     "get_all_decks",
+    "get_all_decks_with_counts",
     "get_deck_card_count",
     "delete_deck",
     "search_decks",
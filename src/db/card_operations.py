@@ -3,13 +3,53 @@ Database operations for Card models.
 
 This module provides CRUD (Create, Read, Update, Delete) operations
 for saving and loading cards from the SQLite database.
+
+Every db_path argument may also be an open sqlite3.Connection, so a
+caller can run several operations on one connection.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 import json
+import sys
 
 from ..db import get_connection_context
-from ..models import Card, Leader, Character, Event, Stage, create_card_from_dict, AnyCard
+from .query_cache import cached_read
+from .schema import FTS_TRIGRAM_SUPPORTED
+from ..models import Card, Leader, Character, Event, Stage, AnyCard
+
+# The trigram tokenizer can't match queries shorter than one trigram
+_FTS_MIN_QUERY_LENGTH = 3
+
+# SQL used by the helpers below. Kept as module constants so each call
+# passes the identical string and hits the connection's statement cache.
+_SELECT_CARDS = "SELECT id, name, card_type, cost, stats, rules_text FROM cards"
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row
+# without firing cards_ad, which would leave cards_fts stale
+_UPSERT_CARD_SQL = """
+    INSERT INTO cards (
+        id, name, card_type, cost, stats, rules_text, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        card_type = excluded.card_type,
+        cost = excluded.cost,
+        stats = excluded.stats,
+        rules_text = excluded.rules_text,
+        updated_at = CURRENT_TIMESTAMP
+"""
+_CARD_BY_ID_SQL = _SELECT_CARDS + " WHERE id = ?"
+_CARD_BY_NAME_SQL = _SELECT_CARDS + " WHERE name = ? LIMIT 1"
+_ALL_CARDS_SQL = _SELECT_CARDS + " ORDER BY name"
+_CARDS_BY_TYPE_SQL = _SELECT_CARDS + " WHERE card_type = ? ORDER BY name"
+_SEARCH_CARDS_LIKE_SQL = _SELECT_CARDS + " WHERE name LIKE ? OR rules_text LIKE ? ORDER BY name"
+_SEARCH_CARDS_FTS_SQL = (
+    _SELECT_CARDS
+    + " WHERE rowid IN (SELECT rowid FROM cards_fts WHERE cards_fts MATCH ?)"
+    + " ORDER BY name"
+)
+_DELETE_CARD_SQL = "DELETE FROM cards WHERE id = ?"
+_COUNT_CARDS_SQL = "SELECT COUNT(*) as count FROM cards"
 
 
 def save_card(card: AnyCard, db_path: Optional[str] = None) -> bool:
@@ -30,33 +70,33 @@ def save_card(card: AnyCard, db_path: Optional[str] = None) -> bool:
         zoro = Character(name="Roronoa Zoro", cost=4, power=5000, counter=1000)
         save_card(zoro)
     """
+    return save_cards([card], db_path)
+
+
+def save_cards(cards: Iterable[AnyCard], db_path: Optional[str] = None) -> bool:
+    """
+    Save several cards to the database in a single transaction.
+    
+    Uses one connection and one commit for the whole batch, which is much
+    faster than calling save_card() in a loop. Existing cards (same ID)
+    are updated.
+    
+    Args:
+        cards: The cards to save
+        db_path: Optional custom database path
+        
+    Returns:
+        True if successful, False otherwise (nothing is saved on failure)
+        
+    Example:
+        save_cards([zoro, nami, sanji])
+    """
     try:
+        rows = [_card_to_row(card) for card in cards]
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
             
-            # Prepare card data for database
-            # JSON encode the stats and cost (for flexibility)
-            stats_json = json.dumps({
-                "power": getattr(card, "power", None),
-                "counter": getattr(card, "counter", None),
-                "life": getattr(card, "life", None),
-            })
-            
-            cost_json = json.dumps({"don": card.cost})
-            
-            # Use INSERT OR REPLACE to handle both insert and update
-            cursor.execute("""
-                INSERT OR REPLACE INTO cards (
-                    id, name, card_type, cost, stats, rules_text, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
-                card.id,
-                card.name,
-                card.card_type,
-                cost_json,
-                stats_json,
-                card.effect_text,
-            ))
+            cursor.executemany(_UPSERT_CARD_SQL, rows)
             
         return True
     except Exception as e:
@@ -64,6 +104,70 @@ def save_card(card: AnyCard, db_path: Optional[str] = None) -> bool:
         return False
 
 
+def _card_to_row(card: AnyCard) -> tuple:
+    """
+    Convert a card to the parameter tuple used by the cards INSERT.
+    
+    Args:
+        card: The card to convert
+        
+    Returns:
+        Tuple of (id, name, card_type, cost, stats, rules_text)
+    """
+    # JSON encode the stats and cost (for flexibility)
+    encode_stats = _STATS_ENCODERS.get(type(card), _encode_any_stats)
+    cost_json = _COST_JSON.get(card.cost) or json.dumps({"don": card.cost})
+    
+    return (
+        card.id,
+        card.name,
+        card.card_type,
+        cost_json,
+        encode_stats(card),
+        card.effect_text,
+    )
+
+
+# Encoded cost for every legal DON!! cost, built once
+_COST_JSON = {cost: json.dumps({"don": cost}) for cost in range(11)}
+
+# Stats are always stored as {"power", "counter", "life"}; each card type
+# gets its own encoder so saving skips the getattr() probing below.
+_STAGE_STATS = json.dumps({"power": None, "counter": None, "life": None})
+
+
+def _encode_any_stats(card: AnyCard) -> str:
+    """Encode the stats of any card, probing for each attribute."""
+    return json.dumps({
+        "power": getattr(card, "power", None),
+        "counter": getattr(card, "counter", None),
+        "life": getattr(card, "life", None),
+    })
+
+
+def _encode_leader_stats(card: Leader) -> str:
+    """Encode a Leader's stats."""
+    return json.dumps({"power": card.power, "counter": None, "life": card.life})
+
+
+def _encode_character_stats(card: Character) -> str:
+    """Encode a Character's stats."""
+    return json.dumps({"power": card.power, "counter": card.counter, "life": None})
+
+
+def _encode_event_stats(card: Event) -> str:
+    """Encode an Event's stats."""
+    return json.dumps({"power": None, "counter": card.counter, "life": None})
+
+
+_STATS_ENCODERS = {
+    Leader: _encode_leader_stats,
+    Character: _encode_character_stats,
+    Event: _encode_event_stats,
+    Stage: lambda card: _STAGE_STATS,
+}
+
+
 def get_card_by_id(card_id: str, db_path: Optional[str] = None) -> Optional[AnyCard]:
     """
     Load a card from the database by its ID.
@@ -83,11 +187,7 @@ def get_card_by_id(card_id: str, db_path: Optional[str] = None) -> Optional[AnyC
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, card_type, cost, stats, rules_text
-                FROM cards
-                WHERE id = ?
-            """, (card_id,))
+            cursor.execute(_CARD_BY_ID_SQL, (card_id,))
             
             row = cursor.fetchone()
             if row is None:
@@ -115,12 +215,7 @@ def get_card_by_name(name: str, db_path: Optional[str] = None) -> Optional[AnyCa
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, card_type, cost, stats, rules_text
-                FROM cards
-                WHERE name = ?
-                LIMIT 1
-            """, (name,))
+            cursor.execute(_CARD_BY_NAME_SQL, (name,))
             
             row = cursor.fetchone()
             if row is None:
@@ -132,6 +227,7 @@ def get_card_by_name(name: str, db_path: Optional[str] = None) -> Optional[AnyCa
         return None
 
 
+@cached_read
 def get_all_cards(db_path: Optional[str] = None) -> List[AnyCard]:
     """
     Load all cards from the database.
@@ -145,11 +241,7 @@ def get_all_cards(db_path: Optional[str] = None) -> List[AnyCard]:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, card_type, cost, stats, rules_text
-                FROM cards
-                ORDER BY name
-            """)
+            cursor.execute(_ALL_CARDS_SQL)
             
             rows = cursor.fetchall()
             return [_row_to_card(row) for row in rows]
@@ -158,6 +250,7 @@ def get_all_cards(db_path: Optional[str] = None) -> List[AnyCard]:
         return []
 
 
+@cached_read
 def get_cards_by_type(card_type: str, db_path: Optional[str] = None) -> List[AnyCard]:
     """
     Load all cards of a specific type from the database.
@@ -176,12 +269,7 @@ def get_cards_by_type(card_type: str, db_path: Optional[str] = None) -> List[Any
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, card_type, cost, stats, rules_text
-                FROM cards
-                WHERE card_type = ?
-                ORDER BY name
-            """, (card_type,))
+            cursor.execute(_CARDS_BY_TYPE_SQL, (card_type,))
             
             rows = cursor.fetchall()
             return [_row_to_card(row) for row in rows]
@@ -190,6 +278,7 @@ def get_cards_by_type(card_type: str, db_path: Optional[str] = None) -> List[Any
         return []
 
 
+@cached_read
 def search_cards(query: str, db_path: Optional[str] = None) -> List[AnyCard]:
     """
     Search for cards by name or effect text.
@@ -208,13 +297,12 @@ def search_cards(query: str, db_path: Optional[str] = None) -> List[AnyCard]:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            search_pattern = f"%{query}%"
-            cursor.execute("""
-                SELECT id, name, card_type, cost, stats, rules_text
-                FROM cards
-                WHERE name LIKE ? OR rules_text LIKE ?
-                ORDER BY name
-            """, (search_pattern, search_pattern))
+            if not _use_fts(query):
+                # No trigram index, or query too short for it - fall back to a scan
+                search_pattern = f"%{query}%"
+                cursor.execute(_SEARCH_CARDS_LIKE_SQL, (search_pattern, search_pattern))
+            else:
+                cursor.execute(_SEARCH_CARDS_FTS_SQL, (_fts_phrase(query),))
             
             rows = cursor.fetchall()
             return [_row_to_card(row) for row in rows]
@@ -223,6 +311,22 @@ def search_cards(query: str, db_path: Optional[str] = None) -> List[AnyCard]:
         return []
 
 
+def _use_fts(query: str) -> bool:
+    """Check whether a search can use the trigram FTS index."""
+    return FTS_TRIGRAM_SUPPORTED and len(query) >= _FTS_MIN_QUERY_LENGTH
+
+
+def _fts_phrase(query: str) -> str:
+    """
+    Quote a user query as a single FTS5 phrase.
+    
+    With the trigram tokenizer a phrase matches as a substring, so this
+    keeps the old LIKE '%query%' semantics while escaping FTS5 syntax
+    characters (quotes, operators like AND/OR/NOT, column filters).
+    """
+    return '"' + query.replace('"', '""') + '"'
+
+
 def delete_card(card_id: str, db_path: Optional[str] = None) -> bool:
     """
     Delete a card from the database.
@@ -237,7 +341,7 @@ def delete_card(card_id: str, db_path: Optional[str] = None) -> bool:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM cards WHERE id = ?", (card_id,))
+            cursor.execute(_DELETE_CARD_SQL, (card_id,))
             return cursor.rowcount > 0
     except Exception as e:
         print(f"Error deleting card: {e}")
@@ -253,32 +357,72 @@ def _row_to_card(row: Dict[str, Any]) -> AnyCard:
         
     Returns:
         Appropriate Card subclass instance
+        
+    Raises:
+        ValueError: If the row's card_type is unknown
     """
+    hydrate = _HYDRATORS.get(row["card_type"])
+    if hydrate is None:
+        raise ValueError(f"Unknown card type: {row['card_type']}")
+    
     # Parse JSON fields
     cost_data = json.loads(row["cost"]) if row["cost"] else {"don": 0}
     stats_data = json.loads(row["stats"]) if row["stats"] else {}
     
-    # Build card data dictionary
-    card_data = {
-        "id": row["id"],
-        "name": row["name"],
-        "card_type": row["card_type"],
-        "cost": cost_data.get("don", 0),
-        "effect_text": row["rules_text"] or "",
-    }
-    
-    # Add type-specific attributes
-    if row["card_type"] == "Leader":
-        card_data["power"] = stats_data.get("power", 5000)
-        card_data["life"] = stats_data.get("life", 5)
-    elif row["card_type"] == "Character":
-        card_data["power"] = stats_data.get("power", 1000)
-        card_data["counter"] = stats_data.get("counter", 0)
-    elif row["card_type"] == "Event":
-        card_data["counter"] = stats_data.get("counter", 0)
-    # Stage doesn't need additional attributes
-    
-    return create_card_from_dict(card_data)
+    return hydrate(row, cost_data.get("don", 0), stats_data)
+
+
+# Rows in the cards table were validated when the card was saved, so
+# loading skips __init__ (kwarg packing, __post_init__ validation and the
+# uuid default) and fills the card's slots directly.
+_set = object.__setattr__
+
+
+def _new_card(cls: type, row: Dict[str, Any], cost: int) -> AnyCard:
+    """Create an uninitialized card of type cls with the base Card fields set."""
+    card = cls.__new__(cls)
+    _set(card, "id", row["id"])
+    _set(card, "name", sys.intern(row["name"]))
+    _set(card, "card_type", row["card_type"])
+    _set(card, "cost", cost)
+    _set(card, "effect_text", row["rules_text"] or "")
+    return card
+
+
+def _hydrate_leader(row: Dict[str, Any], cost: int, stats: Dict[str, Any]) -> Leader:
+    """Build a Leader from a cards row."""
+    card = _new_card(Leader, row, cost)
+    _set(card, "power", stats.get("power", 5000))
+    _set(card, "life", stats.get("life", 5))
+    return card
+
+
+def _hydrate_character(row: Dict[str, Any], cost: int, stats: Dict[str, Any]) -> Character:
+    """Build a Character from a cards row."""
+    card = _new_card(Character, row, cost)
+    _set(card, "power", stats.get("power", 1000))
+    _set(card, "counter", stats.get("counter", 0))
+    return card
+
+
+def _hydrate_event(row: Dict[str, Any], cost: int, stats: Dict[str, Any]) -> Event:
+    """Build an Event from a cards row."""
+    card = _new_card(Event, row, cost)
+    _set(card, "counter", stats.get("counter", 0))
+    return card
+
+
+def _hydrate_stage(row: Dict[str, Any], cost: int, stats: Dict[str, Any]) -> Stage:
+    """Build a Stage from a cards row (no extra attributes)."""
+    return _new_card(Stage, row, cost)
+
+
+_HYDRATORS = {
+    "Leader": _hydrate_leader,
+    "Character": _hydrate_character,
+    "Event": _hydrate_event,
+    "Stage": _hydrate_stage,
+}
 
 
 def get_card_count(db_path: Optional[str] = None) -> int:
@@ -294,7 +438,7 @@ def get_card_count(db_path: Optional[str] = None) -> int:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM cards")
+            cursor.execute(_COUNT_CARDS_SQL)
             result = cursor.fetchone()
             return result["count"]
     except Exception as e:
@@ -5,14 +5,51 @@ This module provides utilities for:
 - Creating database connections
 - Managing connection lifecycle
 - Context managers for safe connection handling
+- A small pool of open connections reused by get_connection_context()
 """
 
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from contextlib import contextmanager
 
-from .schema import DEFAULT_DB_PATH
+from .schema import DEFAULT_DB_PATH, is_uri
+
+# Open connections kept for reuse, most recently used last.
+# Keyed by (thread id, absolute db path) so a thread never shares a
+# connection (and its open transaction) with another thread.
+# _POOL_SIZE bounds the connections each thread keeps; a thread only
+# ever evicts its own idle connections or those of threads that exited.
+_POOL: "OrderedDict[Tuple[int, str], Tuple[sqlite3.Connection, Tuple[int, int]]]" = OrderedDict()
+_POOL_LOCK = threading.Lock()
+_POOL_SIZE = 8
+_STATEMENT_CACHE_SIZE = 256
+
+# Stand-in file identity for URI databases, which are never replaced
+_URI_FILE_ID = (0, 0)
+
+
+# Per-connection settings, applied once when a connection is opened:
+# - foreign_keys: not enabled by default in SQLite
+# - journal_mode=WAL + synchronous=NORMAL: commits append to the WAL
+#   instead of fsyncing the main database file every time
+# - temp_store=MEMORY, cache_size=-65536 (64 MB): keep temp tables and
+#   hot pages in memory
+_CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+"""
+
+
+def _configure(conn: sqlite3.Connection) -> None:
+    """Apply the standard PRAGMAs to a newly opened connection."""
+    conn.executescript(_CONNECTION_PRAGMAS)
 
 
 def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
@@ -32,9 +69,17 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     if db_path is None:
         db_path = DEFAULT_DB_PATH
     
-    # Enable foreign key constraints (not enabled by default in SQLite)
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA foreign_keys = ON")
+    # check_same_thread=False lets close_all() close pooled connections
+    # opened by other threads; a connection is only ever used by its own.
+    # cached_statements keeps prepared statements for every query the
+    # card/deck helpers issue (the default cache holds 128).
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        uri=is_uri(db_path),
+    )
+    _configure(conn)
     
     # Return rows as dictionaries instead of tuples (easier to work with)
     conn.row_factory = sqlite3.Row
@@ -42,6 +87,91 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     return conn
 
 
+def _get_pooled_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Return an open connection for db_path, reusing one from the pool.
+    
+    A pooled connection is discarded if the database file was deleted or
+    replaced since it was opened, so callers always see the current file.
+    URIs (e.g. shared in-memory databases) have no file to check.
+    """
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH
+    
+    uri = is_uri(db_path)
+    path = db_path if uri else os.path.abspath(db_path)
+    key = (threading.get_ident(), path)
+    if uri:
+        file_id = _URI_FILE_ID
+    else:
+        try:
+            st = os.stat(path)
+            file_id = (st.st_dev, st.st_ino)
+        except OSError:
+            file_id = None
+    
+    with _POOL_LOCK:
+        entry = _POOL.pop(key, None)
+    
+    if entry is not None:
+        conn, pooled_file_id = entry
+        if file_id is not None and pooled_file_id == file_id:
+            with _POOL_LOCK:
+                _POOL[key] = entry
+            return conn
+        conn.close()
+    
+    conn = get_connection(db_path)
+    if file_id is None:
+        # sqlite3.connect() just created the file
+        st = os.stat(path)
+        file_id = (st.st_dev, st.st_ino)
+    
+    with _POOL_LOCK:
+        _POOL[key] = (conn, file_id)
+        evicted = _evict_locked(key[0])
+    for old_conn in evicted:
+        old_conn.close()
+    
+    return conn
+
+
+def _evict_locked(thread_id: int) -> list:
+    """
+    Remove surplus connections from the pool and return them for closing.
+    
+    Must be called with _POOL_LOCK held. Connections of threads that have
+    exited are always dropped. Beyond that, only thread_id's own least
+    recently used connections are evicted, and never one with an open
+    transaction: another thread's connection may be in use right now.
+    """
+    live = {thread.ident for thread in threading.enumerate()}
+    evicted = [_POOL.pop(key)[0] for key in list(_POOL) if key[0] not in live]
+    
+    own = [key for key in _POOL if key[0] == thread_id]
+    for key in own[:max(0, len(own) - _POOL_SIZE)]:
+        if not _POOL[key][0].in_transaction:
+            evicted.append(_POOL.pop(key)[0])
+    return evicted
+
+
+def close_all() -> None:
+    """
+    Close every pooled connection.
+    
+    Call this before deleting or replacing a database file that was
+    accessed through get_connection_context(). Otherwise the old
+    connection's -wal file is left next to the new database and SQLite
+    will replay it into the replacement (and on Windows, open files
+    cannot be deleted at all).
+    """
+    with _POOL_LOCK:
+        connections = [conn for conn, _ in _POOL.values()]
+        _POOL.clear()
+    for conn in connections:
+        conn.close()
+
+
 @contextmanager
 def get_connection_context(db_path: Optional[Path] = None):
     """
@@ -49,6 +179,10 @@ def get_connection_context(db_path: Optional[Path] = None):
     
     Args:
         db_path: Path to the database file. If None, uses default location.
+                 May also be an open sqlite3.Connection, which is used
+                 as-is (its row_factory is sqlite3.Row inside the block and
+                 restored afterwards). Open it with get_connection() so
+                 foreign keys are enforced.
         
     Yields:
         sqlite3.Connection: Active database connection
@@ -58,12 +192,84 @@ def get_connection_context(db_path: Optional[Path] = None):
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM cards")
             results = cursor.fetchall()
-        # Connection automatically closed after the 'with' block
+        # Changes committed after the 'with' block
         
     This is the recommended way to work with the database because:
-    - Automatically closes the connection
+    - Reuses a pooled connection instead of reconnecting every call
     - Handles exceptions gracefully
     - Commits on success, rolls back on error
+    
+    The block runs inside transaction(), so nested contexts on the same
+    database only commit or roll back their own changes.
+    
+    The connection stays open for reuse; use close_all() to release it,
+    or get_closing_connection_context() for a one-off connection.
+    """
+    if not isinstance(db_path, sqlite3.Connection):
+        conn = _get_pooled_connection(db_path)
+        with transaction(conn):
+            yield conn
+        return
+    
+    # A borrowed connection: the card/deck helpers read columns by name,
+    # but the caller's row_factory is put back once the block exits
+    conn = db_path
+    row_factory = conn.row_factory
+    conn.row_factory = sqlite3.Row
+    try:
+        with transaction(conn):
+            yield conn
+    finally:
+        conn.row_factory = row_factory
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    Run a block of work on an open connection as one savepoint.
+    
+    Args:
+        conn: Open database connection (e.g. a pooled one)
+        
+    Yields:
+        sqlite3.Connection: The same connection
+        
+    Usage:
+        with transaction(conn):
+            conn.execute("DELETE FROM cards WHERE id = ?", (card_id,))
+        # Released (committed, if outermost) after the 'with' block
+    
+    Uses SAVEPOINT/RELEASE rather than COMMIT, so transactions nest: an
+    inner block that fails rolls back only its own changes. The
+    outermost RELEASE commits.
+    """
+    conn.execute("SAVEPOINT tx")
+    try:
+        yield conn
+    except Exception:
+        # SQLite may already have rolled back the whole transaction
+        # (e.g. on a ROLLBACK conflict clause), taking the savepoint with it
+        if conn.in_transaction:
+            conn.execute("ROLLBACK TO tx")  # Roll back if there was an error
+            conn.execute("RELEASE tx")
+        raise
+    else:
+        conn.execute("RELEASE tx")  # Commit if everything succeeded
+
+
+@contextmanager
+def get_closing_connection_context(db_path: Optional[Path] = None):
+    """
+    Context manager for a fresh, unpooled database connection.
+    
+    Same as get_connection_context() but opens a new connection and
+    closes it when the 'with' block exits.
+    
+    Args:
+        db_path: Path to the database file. If None, uses default location.
+        
+    Yields:
+        sqlite3.Connection: Active database connection
     """
     conn = get_connection(db_path)
     try:
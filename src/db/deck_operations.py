@@ -3,14 +3,67 @@ Database operations for Deck models.
 
 This module provides CRUD operations for saving and loading decks
 (including their card associations) from the SQLite database.
+
+Every db_path argument may also be an open sqlite3.Connection, so a
+caller can run several operations on one connection.
 """
 
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 import json
 
 from ..db import get_connection_context
 from ..models import Deck, Leader, create_card_from_dict, AnyCard
-from .card_operations import _row_to_card
+from .card_operations import _fts_phrase, _row_to_card, _use_fts
+
+# SQL used by the helpers below, kept as module constants like the
+# card queries in card_operations.
+_SELECT_DECKS = "SELECT id, name, description FROM decks"
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row
+# without firing the decks_fts delete trigger.
+_UPSERT_DECK_SQL = (
+    "INSERT INTO decks (id, name, description, updated_at)"
+    " VALUES (?, ?, ?, CURRENT_TIMESTAMP)"
+    " ON CONFLICT(id) DO UPDATE SET"
+    " name = excluded.name, description = excluded.description,"
+    " updated_at = excluded.updated_at"
+)
+_DELETE_DECK_CARDS_SQL = "DELETE FROM deck_cards WHERE deck_id = ?"
+_INSERT_DECK_CARDS_SQL = "INSERT INTO deck_cards (deck_id, card_id, quantity) VALUES "
+# Rows per multi-row INSERT: 3 parameters each, kept under SQLite's
+# historical 999 bound-parameter limit
+_DECK_CARD_ROWS_PER_INSERT = 999 // 3
+_DECK_BY_ID_SQL = _SELECT_DECKS + " WHERE id = ?"
+_DECK_BY_NAME_SQL = _SELECT_DECKS + " WHERE name = ? LIMIT 1"
+_DECK_CARDS_SQL = (
+    "SELECT c.id, c.name, c.card_type, c.cost, c.stats, c.rules_text, dc.quantity"
+    " FROM deck_cards dc JOIN cards c ON dc.card_id = c.id"
+    " WHERE dc.deck_id = ? ORDER BY c.name"
+)
+_ALL_DECKS_SQL = _SELECT_DECKS + " ORDER BY name"
+# The per-deck sum is served by idx_deck_cards_deck_id_qty
+_ALL_DECKS_WITH_COUNTS_SQL = (
+    "SELECT id, name, description,"
+    " (SELECT COALESCE(SUM(quantity), 0) FROM deck_cards"
+    " WHERE deck_id = decks.id) as total"
+    " FROM decks ORDER BY name"
+)
+_DECK_CARD_COUNT_SQL = (
+    "SELECT SUM(quantity) as total FROM deck_cards WHERE deck_id = ?"
+)
+_DELETE_DECK_SQL = "DELETE FROM decks WHERE id = ?"
+_SEARCH_DECKS_LIKE_SQL = (
+    _SELECT_DECKS
+    + " WHERE name LIKE ? OR description LIKE ? ORDER BY name"
+)
+_SEARCH_DECKS_FTS_SQL = (
+    _SELECT_DECKS
+    + " WHERE rowid IN (SELECT rowid FROM decks_fts WHERE decks_fts MATCH ?)"
+    + " ORDER BY name"
+)
+_COUNT_DECKS_SQL = "SELECT COUNT(*) as count FROM decks"
 
 
 def save_deck(deck: Deck, db_path: Optional[str] = None) -> bool:
@@ -38,11 +91,7 @@ def save_deck(deck: Deck, db_path: Optional[str] = None) -> bool:
             cursor = conn.cursor()
             
             # Save the deck metadata
-            cursor.execute("""
-                INSERT OR REPLACE INTO decks (
-                    id, name, description, updated_at
-                ) VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
+            cursor.execute(_UPSERT_DECK_SQL, (
                 deck.id,
                 deck.name,
                 deck.description,
@@ -54,17 +103,17 @@ def save_deck(deck: Deck, db_path: Optional[str] = None) -> bool:
             # This is a design decision - leaders aren't in the 50-card deck
             
             # Delete old card associations
-            cursor.execute("DELETE FROM deck_cards WHERE deck_id = ?", (deck.id,))
+            cursor.execute(_DELETE_DECK_CARDS_SQL, (deck.id,))
             
-            # Save card associations
-            card_counts = deck.get_card_counts()
-            for card in deck.cards:
-                cursor.execute("""
-                    INSERT INTO deck_cards (deck_id, card_id, quantity)
-                    VALUES (?, ?, 1)
-                    ON CONFLICT(deck_id, card_id) DO UPDATE SET
-                        quantity = quantity + 1
-                """, (deck.id, card.id))
+            # Save card associations (one row per distinct card), as
+            # few multi-row INSERT statements as the parameter limit allows
+            card_quantities = list(Counter(card.id for card in deck.cards).items())
+            for start in range(0, len(card_quantities), _DECK_CARD_ROWS_PER_INSERT):
+                chunk = card_quantities[start:start + _DECK_CARD_ROWS_PER_INSERT]
+                params = []
+                for card_id, quantity in chunk:
+                    params += (deck.id, card_id, quantity)
+                cursor.execute(_insert_deck_cards_sql(len(chunk)), params)
             
             return True
     except Exception as e:
@@ -72,6 +121,12 @@ def save_deck(deck: Deck, db_path: Optional[str] = None) -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
+def _insert_deck_cards_sql(row_count: int) -> str:
+    """Return a deck_cards INSERT with row_count (?, ?, ?) value rows."""
+    return _INSERT_DECK_CARDS_SQL + ", ".join(["(?, ?, ?)"] * row_count)
+
+
 def get_deck_by_id(deck_id: str, db_path: Optional[str] = None) -> Optional[Deck]:
     """
     Load a deck from the database by its ID.
@@ -94,45 +149,49 @@ def get_deck_by_id(deck_id: str, db_path: Optional[str] = None) -> Optional[Deck
             cursor = conn.cursor()
             
             # Load deck metadata
-            cursor.execute("""
-                SELECT id, name, description
-                FROM decks
-                WHERE id = ?
-            """, (deck_id,))
+            cursor.execute(_DECK_BY_ID_SQL, (deck_id,))
             
             row = cursor.fetchone()
             if row is None:
                 return None
             
-            deck = Deck(
-                id=row["id"],
-                name=row["name"],
-                description=row["description"] or "",
-            )
-            
-            # Load associated cards
-            cursor.execute("""
-                SELECT c.id, c.name, c.card_type, c.cost, c.stats, c.rules_text, dc.quantity
-                FROM deck_cards dc
-                JOIN cards c ON dc.card_id = c.id
-                WHERE dc.deck_id = ?
-                ORDER BY c.name
-            """, (deck_id,))
-            
-            rows = cursor.fetchall()
-            for row in rows:
-                card = _row_to_card(row)
-                quantity = row["quantity"]
-                # Add card multiple times if quantity > 1
-                for _ in range(quantity):
-                    deck.cards.append(card)
-            
-            return deck
+            return _load_deck(cursor, row)
     except Exception as e:
         print(f"Error loading deck: {e}")
         return None
 
 
+def _load_deck(cursor, row) -> Deck:
+    """
+    Build a Deck from its decks row and load its cards.
+    
+    Args:
+        cursor: Open cursor to run the card query on
+        row: Row with the deck's id, name and description
+        
+    Returns:
+        Deck instance with its cards
+    """
+    deck = Deck(
+        id=row["id"],
+        name=row["name"],
+        description=row["description"] or "",
+    )
+    
+    # Load associated cards
+    cursor.execute(_DECK_CARDS_SQL, (deck.id,))
+    
+    rows = cursor.fetchall()
+    for row in rows:
+        card = _row_to_card(row)
+        quantity = row["quantity"]
+        # Add card multiple times if quantity > 1
+        for _ in range(quantity):
+            deck.cards.append(card)
+    
+    return deck
+
+
 def get_deck_by_name(name: str, db_path: Optional[str] = None) -> Optional[Deck]:
     """
     Load a deck from the database by its name.
@@ -149,18 +208,14 @@ def get_deck_by_name(name: str, db_path: Optional[str] = None) -> Optional[Deck]
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id
-                FROM decks
-                WHERE name = ?
-                LIMIT 1
-            """, (name,))
+            cursor.execute(_DECK_BY_NAME_SQL, (name,))
             
             row = cursor.fetchone()
             if row is None:
                 return None
             
-            return get_deck_by_id(row["id"], db_path)
+            # Build from this row rather than re-fetching it by ID
+            return _load_deck(cursor, row)
     except Exception as e:
         print(f"Error loading deck: {e}")
         return None
@@ -182,11 +237,7 @@ def get_all_decks(db_path: Optional[str] = None) -> List[Deck]:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, description
-                FROM decks
-                ORDER BY name
-            """)
+            cursor.execute(_ALL_DECKS_SQL)
             
             rows = cursor.fetchall()
             decks = []
@@ -204,6 +255,40 @@ def get_all_decks(db_path: Optional[str] = None) -> List[Deck]:
         return []
 
 
+def get_all_decks_with_counts(db_path: Optional[str] = None) -> List[Tuple[Deck, int]]:
+    """
+    Load all decks (metadata only) together with their card counts.
+    
+    Use this instead of calling get_deck_card_count() for each deck
+    from get_all_decks(): one query returns every deck and its count.
+    
+    Args:
+        db_path: Optional custom database path
+        
+    Returns:
+        List of (Deck with empty card list, number of cards) tuples
+    """
+    try:
+        with get_connection_context(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(_ALL_DECKS_WITH_COUNTS_SQL)
+            
+            return [
+                (
+                    Deck(
+                        id=row["id"],
+                        name=row["name"],
+                        description=row["description"] or "",
+                    ),
+                    row["total"],
+                )
+                for row in cursor.fetchall()
+            ]
+    except Exception as e:
+        print(f"Error loading decks: {e}")
+        return []
+
+
 def get_deck_card_count(deck_id: str, db_path: Optional[str] = None) -> int:
     """
     Get the number of cards in a deck without loading the entire deck.
@@ -218,11 +303,7 @@ def get_deck_card_count(deck_id: str, db_path: Optional[str] = None) -> int:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT SUM(quantity) as total
-                FROM deck_cards
-                WHERE deck_id = ?
-            """, (deck_id,))
+            cursor.execute(_DECK_CARD_COUNT_SQL, (deck_id,))
             
             result = cursor.fetchone()
             return result["total"] if result["total"] else 0
@@ -247,7 +328,7 @@ def delete_deck(deck_id: str, db_path: Optional[str] = None) -> bool:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM decks WHERE id = ?", (deck_id,))
+            cursor.execute(_DELETE_DECK_SQL, (deck_id,))
             return cursor.rowcount > 0
     except Exception as e:
         print(f"Error deleting deck: {e}")
@@ -268,13 +349,12 @@ def search_decks(query: str, db_path: Optional[str] = None) -> List[Deck]:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            search_pattern = f"%{query}%"
-            cursor.execute("""
-                SELECT id, name, description
-                FROM decks
-                WHERE name LIKE ? OR description LIKE ?
-                ORDER BY name
-            """, (search_pattern, search_pattern))
+            if not _use_fts(query):
+                # No trigram index, or query too short for it - fall back to a scan
+                search_pattern = f"%{query}%"
+                cursor.execute(_SEARCH_DECKS_LIKE_SQL, (search_pattern, search_pattern))
+            else:
+                cursor.execute(_SEARCH_DECKS_FTS_SQL, (_fts_phrase(query),))
             
             rows = cursor.fetchall()
             decks = []
@@ -305,7 +385,7 @@ def get_deck_count(db_path: Optional[str] = None) -> int:
     try:
         with get_connection_context(db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM decks")
+            cursor.execute(_COUNT_DECKS_SQL)
             result = cursor.fetchone()
             return result["count"]
     except Exception as e:
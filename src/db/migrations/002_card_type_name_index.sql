@@ -0,0 +1,18 @@
+-- Migration 002: Composite card type/name index
+-- Date: 2026-10-16
+-- Description: Replaces idx_cards_type with idx_cards_type_name so
+--              get_cards_by_type() can filter by type and return rows
+--              already ordered by name, without a separate sort step.
+
+BEGIN TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS idx_cards_type_name ON cards(card_type, name);
+
+-- (card_type, name) covers every lookup the single-column index served
+DROP INDEX IF EXISTS idx_cards_type;
+
+-- Record this migration
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES (2, 'Composite cards(card_type, name) index');
+
+COMMIT;
@@ -0,0 +1,41 @@
+-- Migration 003: Card full-text search
+-- Date: 2026-10-16
+-- Description: Adds the cards_fts FTS5 table over cards(name, rules_text)
+--              so search_cards() no longer scans every row with LIKE.
+--              Uses the trigram tokenizer to keep substring matching.
+-- Requires: SQLite 3.34+ (trigram tokenizer)
+
+BEGIN TRANSACTION;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+    name, rules_text,
+    content='cards', content_rowid='rowid',
+    tokenize='trigram'
+);
+
+-- Keep the index in sync with the cards table
+CREATE TRIGGER IF NOT EXISTS cards_ai AFTER INSERT ON cards BEGIN
+    INSERT INTO cards_fts (rowid, name, rules_text)
+    VALUES (new.rowid, new.name, new.rules_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_ad AFTER DELETE ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, name, rules_text)
+    VALUES ('delete', old.rowid, old.name, old.rules_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_au AFTER UPDATE ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, name, rules_text)
+    VALUES ('delete', old.rowid, old.name, old.rules_text);
+    INSERT INTO cards_fts (rowid, name, rules_text)
+    VALUES (new.rowid, new.name, new.rules_text);
+END;
+
+-- Index cards that already exist
+INSERT INTO cards_fts (cards_fts) VALUES ('rebuild');
+
+-- Record this migration
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES (3, 'Full-text search table cards_fts');
+
+COMMIT;
@@ -0,0 +1,41 @@
+-- Migration 004: Deck full-text search
+-- Date: 2026-10-16
+-- Description: Adds the decks_fts FTS5 table over decks(name, description)
+--              so search_decks() no longer scans every row with LIKE.
+--              Uses the trigram tokenizer to keep substring matching.
+-- Requires: SQLite 3.34+ (trigram tokenizer)
+
+BEGIN TRANSACTION;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS decks_fts USING fts5(
+    name, description,
+    content='decks', content_rowid='rowid',
+    tokenize='trigram'
+);
+
+-- Keep the index in sync with the decks table
+CREATE TRIGGER IF NOT EXISTS decks_ai AFTER INSERT ON decks BEGIN
+    INSERT INTO decks_fts (rowid, name, description)
+    VALUES (new.rowid, new.name, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS decks_ad AFTER DELETE ON decks BEGIN
+    INSERT INTO decks_fts (decks_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS decks_au AFTER UPDATE ON decks BEGIN
+    INSERT INTO decks_fts (decks_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+    INSERT INTO decks_fts (rowid, name, description)
+    VALUES (new.rowid, new.name, new.description);
+END;
+
+-- Index decks that already exist
+INSERT INTO decks_fts (decks_fts) VALUES ('rebuild');
+
+-- Record this migration
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES (4, 'Full-text search table decks_fts');
+
+COMMIT;
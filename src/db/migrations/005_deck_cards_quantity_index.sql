@@ -0,0 +1,17 @@
+-- Migration 005: Covering deck_cards(deck_id, quantity) index
+-- Date: 2026-10-16
+-- Description: Lets get_deck_card_count() sum quantities from the index
+--              alone instead of visiting each deck_cards row, then
+--              refreshes planner statistics with ANALYZE.
+
+BEGIN TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS idx_deck_cards_deck_id_qty ON deck_cards(deck_id, quantity);
+
+-- Record this migration
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES (5, 'Covering deck_cards(deck_id, quantity) index');
+
+COMMIT;
+
+ANALYZE;
@@ -0,0 +1,127 @@
+"""
+Read-query result cache for TCG Deckhand.
+
+This module provides:
+- cached_read: decorator that memoizes read-only card queries
+- connection_stamp: cheap "has the database changed?" check
+- clear_query_cache: drop all cached results
+
+Cached results are only reused while nothing could have changed them:
+the same pooled connection is in use, no other connection has committed
+(PRAGMA data_version) and this connection has made no writes
+(total_changes). Writes therefore invalidate the cache automatically,
+whether they go through card_operations or raw SQL.
+
+Results read inside a caller's open transaction are never stored: a
+rollback changes neither stamp value, so they could outlive the rows
+they came from.
+
+Set the DECKHAND_NO_QCACHE environment variable to bypass the cache.
+"""
+
+import functools
+import inspect
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from .connection import get_connection_context
+from .schema import DEFAULT_DB_PATH, is_uri
+
+# Maximum number of cached query results (least recently used evicted)
+_CACHE_SIZE = 128
+
+# (function, args, absolute db path) -> (connection, stamp, result)
+_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[sqlite3.Connection, Tuple[int, int], List[Any]]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def db_cache_key(db_path: Optional[str]) -> Hashable:
+    """
+    Return the cache key for a database path, URI or open connection.
+    
+    Paths are made absolute (default applied); URIs and connections are
+    used as-is.
+    """
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH
+    if isinstance(db_path, sqlite3.Connection) or is_uri(db_path):
+        return db_path
+    return os.path.abspath(db_path)
+
+
+def connection_stamp(conn: sqlite3.Connection) -> Tuple[int, int]:
+    """
+    Return a stamp that changes whenever the database may have changed.
+
+    PRAGMA data_version changes when another connection commits;
+    total_changes counts every row this connection has written.
+    """
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    return (data_version, conn.total_changes)
+
+
+def clear_query_cache() -> None:
+    """Drop every cached query result."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def cached_read(func: Callable[..., List[Any]]) -> Callable[..., List[Any]]:
+    """
+    Memoize a read-only query function that returns a list.
+
+    The decorated function must take a db_path parameter and return a
+    list of immutable items (e.g. frozen cards). Callers get a fresh
+    list each time, so mutating it does not affect the cache.
+
+    Usage:
+        @cached_read
+        def get_all_cards(db_path=None):
+            ...
+    """
+    db_path_index = list(inspect.signature(func).parameters).index("db_path")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if os.environ.get("DECKHAND_NO_QCACHE"):
+            return func(*args, **kwargs)
+
+        if "db_path" in kwargs:
+            db_path = kwargs["db_path"]
+        elif len(args) > db_path_index:
+            db_path = args[db_path_index]
+        else:
+            db_path = None
+        query_args = args[:db_path_index] + tuple(
+            sorted((k, v) for k, v in kwargs.items() if k != "db_path")
+        )
+        key = (func, query_args, db_cache_key(db_path))
+
+        try:
+            with get_connection_context(db_path) as conn:
+                stamp = connection_stamp(conn)
+        except sqlite3.Error:
+            return func(*args, **kwargs)
+
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+            if entry is not None and entry[0] is conn and entry[1] == stamp:
+                _CACHE.move_to_end(key)
+                return list(entry[2])
+
+        result = func(*args, **kwargs)
+
+        # Still inside a caller's transaction: the rows may be rolled back
+        if conn.in_transaction:
+            return result
+
+        with _CACHE_LOCK:
+            _CACHE[key] = (conn, stamp, list(result))
+            while len(_CACHE) > _CACHE_SIZE:
+                _CACHE.popitem(last=False)
+        return result
+
+    return wrapper
@@ -7,18 +7,44 @@ This module defines the database structure for storing:
 - Game session history
 """
 
+import functools
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 # Default database location
 DEFAULT_DB_PATH = Path.home() / ".tcg_deckhand" / "deckhand.db"
 
 # Current schema version (update when creating migrations)
-CURRENT_SCHEMA_VERSION = 1
+CURRENT_SCHEMA_VERSION = 5
 
+# The full-text search tables (migrations 003 and 004) use the FTS5
+# trigram tokenizer, which needs SQLite 3.34 or newer
+FTS_MIN_SQLITE_VERSION = (3, 34, 0)
 
-def get_schema() -> str:
+
+def _has_fts_trigram() -> bool:
+    """Check whether this SQLite build supports FTS5 with the trigram tokenizer."""
+    if sqlite3.sqlite_version_info < FTS_MIN_SQLITE_VERSION:
+        return False
+    # FTS5 itself can be compiled out, so try creating a table
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(text, tokenize='trigram')")
+        return True
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
+
+
+# Without trigram FTS the search tables are left out of the schema and
+# search_cards()/search_decks() fall back to LIKE scans
+FTS_TRIGRAM_SUPPORTED = _has_fts_trigram()
+
+
+@functools.lru_cache(maxsize=2)
+def get_schema(include_fts: bool = FTS_TRIGRAM_SUPPORTED) -> str:
     """
     Returns the SQL schema for creating all database tables.
     
@@ -27,9 +53,16 @@ def get_schema() -> str:
     - Stats are stored as JSON for flexibility
     - Rules text is stored as plain text (future: parse into effects)
     
-    Note: This matches migration 001_initial_schema.sql
+    Args:
+        include_fts: Include the cards_fts/decks_fts search tables
+            (default: when this SQLite build supports them)
+    
+    Note: This matches migrations 001 through 005 in src/db/migrations/
     """
-    return """
+    return _BASE_SCHEMA + (_FTS_SCHEMA if include_fts else "") + _SCHEMA_VERSIONS
+
+
+_BASE_SCHEMA = """
     -- Schema Version Tracking
     -- Tracks which migrations have been applied
     CREATE TABLE IF NOT EXISTS schema_version (
@@ -89,14 +122,126 @@ def get_schema() -> str:
 
     -- Indexes for common queries
     CREATE INDEX IF NOT EXISTS idx_cards_name ON cards(name);
-    CREATE INDEX IF NOT EXISTS idx_cards_type ON cards(card_type);
+    -- (card_type, name) serves both the type filter and the ORDER BY name
+    CREATE INDEX IF NOT EXISTS idx_cards_type_name ON cards(card_type, name);
+    -- (deck_id, quantity) lets get_deck_card_count() read only the index
+    CREATE INDEX IF NOT EXISTS idx_deck_cards_deck_id_qty ON deck_cards(deck_id, quantity);
     CREATE INDEX IF NOT EXISTS idx_game_sessions_player_deck ON game_sessions(player_deck_id);
     CREATE INDEX IF NOT EXISTS idx_game_sessions_winner ON game_sessions(winner);
+"""
+
+_FTS_SCHEMA = """
+    -- Full-text index over card name and rules text (used by search_cards)
+    -- External-content table: text lives in cards, triggers keep it in sync.
+    -- The trigram tokenizer keeps substring, case-insensitive matching.
+    CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+        name, rules_text,
+        content='cards', content_rowid='rowid',
+        tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS cards_ai AFTER INSERT ON cards BEGIN
+        INSERT INTO cards_fts (rowid, name, rules_text)
+        VALUES (new.rowid, new.name, new.rules_text);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS cards_ad AFTER DELETE ON cards BEGIN
+        INSERT INTO cards_fts (cards_fts, rowid, name, rules_text)
+        VALUES ('delete', old.rowid, old.name, old.rules_text);
+    END;
 
+    CREATE TRIGGER IF NOT EXISTS cards_au AFTER UPDATE ON cards BEGIN
+        INSERT INTO cards_fts (cards_fts, rowid, name, rules_text)
+        VALUES ('delete', old.rowid, old.name, old.rules_text);
+        INSERT INTO cards_fts (rowid, name, rules_text)
+        VALUES (new.rowid, new.name, new.rules_text);
+    END;
+
+    -- Full-text index over deck name and description (used by search_decks)
+    CREATE VIRTUAL TABLE IF NOT EXISTS decks_fts USING fts5(
+        name, description,
+        content='decks', content_rowid='rowid',
+        tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS decks_ai AFTER INSERT ON decks BEGIN
+        INSERT INTO decks_fts (rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS decks_ad AFTER DELETE ON decks BEGIN
+        INSERT INTO decks_fts (decks_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS decks_au AFTER UPDATE ON decks BEGIN
+        INSERT INTO decks_fts (decks_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+        INSERT INTO decks_fts (rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END;
+"""
+
+_SCHEMA_VERSIONS = """
     -- Record initial schema version
     INSERT OR IGNORE INTO schema_version (version, description)
     VALUES (1, 'Initial schema - cards, decks, deck_cards, game_sessions');
+    INSERT OR IGNORE INTO schema_version (version, description)
+    VALUES (2, 'Composite cards(card_type, name) index');
+    INSERT OR IGNORE INTO schema_version (version, description)
+    VALUES (3, 'Full-text search table cards_fts');
+    INSERT OR IGNORE INTO schema_version (version, description)
+    VALUES (4, 'Full-text search table decks_fts');
+    INSERT OR IGNORE INTO schema_version (version, description)
+    VALUES (5, 'Covering deck_cards(deck_id, quantity) index');
+"""
+
+
+def _split_statements(script: str) -> Tuple[str, ...]:
+    """
+    Split a SQL script into individual statements.
+    
+    Uses sqlite3.complete_statement() rather than splitting on ";" so
+    statements containing semicolons (e.g. trigger bodies) stay whole.
     """
+    statements = []
+    current = ""
+    for line in script.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ""
+    return tuple(statements)
+
+
+# FTS tables in the schema. They are external-content tables, so one
+# created on a database that already holds rows starts out empty;
+# init_database() rebuilds each one it creates (as migrations 003-004 do)
+_FTS_TABLES = ("cards_fts", "decks_fts")
+
+
+# Schema pre-split once at import so init_database() can execute each
+# statement directly instead of re-parsing the whole script every call
+_SCHEMA_STATEMENTS = _split_statements(get_schema())
+
+
+def is_uri(db_path) -> bool:
+    """
+    Check whether db_path is an SQLite URI rather than a file path.
+    
+    Example:
+        "file:decks?mode=memory&cache=shared"
+    """
+    return isinstance(db_path, str) and db_path.startswith("file:")
+
+
+def _missing_fts_tables(cursor: sqlite3.Cursor) -> Tuple[str, ...]:
+    """Return the FTS tables init_database() is about to create."""
+    if not FTS_TRIGRAM_SUPPORTED:
+        return ()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    existing = {row[0] for row in cursor.fetchall()}
+    return tuple(table for table in _FTS_TABLES if table not in existing)
 
 
 def init_database(db_path: Optional[Path | str] = None) -> None:
@@ -104,29 +249,50 @@ def init_database(db_path: Optional[Path | str] = None) -> None:
     Initialize the database by creating all tables.
     
     Args:
-        db_path: Path to the database file (Path object or string). 
-                 If None, uses default location.
+        db_path: Path to the database file (Path object or string),
+                 or an SQLite "file:" URI. If None, uses default location.
+        
+    Note:
+        A shared in-memory URI only keeps its tables while some other
+        connection to it stays open.
         
     This function:
     1. Creates the database directory if it doesn't exist
     2. Connects to the SQLite database (creates file if needed)
-    3. Executes the schema SQL to create all tables
-    4. Commits changes and closes connection
+    3. Switches the database to WAL journal mode
+    4. Executes the schema SQL to create all tables, indexing existing
+       rows in any full-text search table it creates
+    5. Runs ANALYZE so the query planner has index statistics
+    6. Commits changes and closes connection
     """
+    uri = is_uri(db_path)
     if db_path is None:
         db_path = DEFAULT_DB_PATH
-    else:
+    elif not uri:
         # Convert string to Path if needed
         db_path = Path(db_path) if isinstance(db_path, str) else db_path
     
     # Create directory if it doesn't exist
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if not uri:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Connect and create tables
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, uri=uri)
     try:
+        # WAL mode is stored in the database file, so every later
+        # connection starts in WAL too (per-connection PRAGMAs such as
+        # cache_size are applied by connection.get_connection())
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        
         cursor = conn.cursor()
-        cursor.executescript(get_schema())
+        new_fts_tables = _missing_fts_tables(cursor)
+        for statement in _SCHEMA_STATEMENTS:
+            cursor.execute(statement)
+        # Index rows that existed before the FTS tables did
+        for table in new_fts_tables:
+            cursor.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+        cursor.execute("ANALYZE")
         conn.commit()
         print(f"✅ Database initialized successfully at: {db_path}")
     except sqlite3.Error as e:
@@ -154,10 +320,11 @@ def get_schema_version(db_path: Optional[Path] = None) -> int:
     if db_path is None:
         db_path = DEFAULT_DB_PATH
     
-    if not db_path.exists():
+    uri = is_uri(db_path)
+    if not uri and not Path(db_path).exists():
         return 0
     
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, uri=uri)
     try:
         cursor = conn.cursor()
         # Check if schema_version table exists
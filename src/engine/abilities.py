@@ -18,7 +18,8 @@ One Piece TCG Ability Keywords:
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from functools import lru_cache
+from typing import FrozenSet, Optional, List
 import re
 
 from ..models import AnyCard, Character, Event, Leader, Stage
@@ -158,8 +159,19 @@ def has_ability(card: AnyCard, ability_type: AbilityType) -> bool:
     if not card.effect_text:
         return False
     
-    abilities = parse_abilities(card.effect_text)
-    return any(ability.ability_type == ability_type for ability in abilities)
+    return ability_type in _ability_types(card.effect_text)
+
+
+@lru_cache(maxsize=1024)
+def _ability_types(effect_text: str) -> FrozenSet[AbilityType]:
+    """
+    Return the ability types found in an effect text.
+    
+    Rules and AIs ask about the same few cards over and over (Rush on
+    every attack check, Blocker on every defense), so the parse result
+    is kept per distinct effect text.
+    """
+    return frozenset(ability.ability_type for ability in parse_abilities(effect_text))
 
 
 def has_rush(card: AnyCard) -> bool:
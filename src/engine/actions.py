@@ -27,7 +27,7 @@ class ActionType(Enum):
     DECLINE_TRIGGER = "decline_trigger"  # Choose not to use trigger
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """
     Base class for all game actions.
@@ -43,7 +43,7 @@ class Action:
         return f"{self.player_id}: {self.action_type.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayCardAction(Action):
     """
     Play a card from hand to the field.
@@ -62,7 +62,7 @@ class PlayCardAction(Action):
         return f"{self.player_id}: Play {self.card.name} (cost {self.don_to_rest} DON!!)"
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackAction(Action):
     """
     Attack with a character or leader.
@@ -84,7 +84,7 @@ class AttackAction(Action):
         return f"{self.player_id}: {attacker} attacks {self.target_id[:8]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AttachDonAction(Action):
     """
     Attach DON!! from don area to a character or leader.
@@ -106,7 +106,7 @@ class AttachDonAction(Action):
         return f"{self.player_id}: Attach {self.don_count} DON!! to {self.target_id[:8]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DetachDonAction(Action):
     """
     Remove DON!! from a character or leader (usually at turn start).
@@ -125,7 +125,7 @@ class DetachDonAction(Action):
         return f"{self.player_id}: Detach {self.don_count} DON!! from {self.target_id[:8]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class UseCounterAction(Action):
     """
     Play a counter card from hand during opponent's attack.
@@ -148,7 +148,7 @@ class UseCounterAction(Action):
         return f"{self.player_id}: Use counter {self.counter_card.name}{target}"
 
 
-@dataclass
+@dataclass(slots=True)
 class UseBlockerAction(Action):
     """
     Block an attack with a character that has the Blocker ability.
@@ -170,7 +170,7 @@ class UseBlockerAction(Action):
         return f"{self.player_id}: Block with {self.blocker_id[:8]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivateAbilityAction(Action):
     """
     Activate a card's special ability.
@@ -192,7 +192,7 @@ class ActivateAbilityAction(Action):
         return f"{self.player_id}: Activate ability on {self.card_id[:8]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class UseTriggerAction(Action):
     """
     Activate a trigger effect from a life card.
@@ -212,7 +212,7 @@ class UseTriggerAction(Action):
         return f"{self.player_id}: Use trigger {self.card.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclineTriggerAction(Action):
     """
     Choose not to activate a trigger effect (just add card to hand).
@@ -229,7 +229,7 @@ class DeclineTriggerAction(Action):
         return f"{self.player_id}: Decline trigger {self.card.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PassPhaseAction(Action):
     """
     End the current phase and advance to the next.
@@ -245,7 +245,7 @@ class PassPhaseAction(Action):
         return f"{self.player_id}: Pass phase"
 
 
-@dataclass
+@dataclass(slots=True)
 class MulliganAction(Action):
     """
     Reshuffle starting hand back into deck and draw a new hand.
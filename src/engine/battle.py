@@ -126,18 +126,16 @@ def initiate_battle(
     if is_leader_attack:
         attacker_power = attacker.leader.power
         # Add DON!! attached to leader
-        if "leader" in attacker.attached_don:
-            attacker_power += attacker.attached_don["leader"] * 1000
+        attacker_power += attacker.attached_don.get("leader", 0) * 1000
     else:
         # Find attacker character
-        attacker_char = next((c for c in attacker.characters if c.id == attacker_id), None)
+        attacker_char = attacker.find_character(attacker_id)
         if not attacker_char:
             raise ValueError(f"Attacker {attacker_id} not found in player's characters")
         
         attacker_power = attacker_char.power
         # Add DON!! attached to character
-        if attacker_id in attacker.attached_don:
-            attacker_power += attacker.attached_don[attacker_id] * 1000
+        attacker_power += attacker.attached_don.get(attacker_id, 0) * 1000
     
     # Get defender power
     if target_is_leader:
@@ -145,7 +143,7 @@ def initiate_battle(
         # DON!! on leader only count during defender's turn (not now)
     else:
         # Find defender character
-        defender_char = next((c for c in defender.characters if c.id == target_id), None)
+        defender_char = defender.find_character(target_id)
         if not defender_char:
             raise ValueError(f"Target {target_id} not found in opponent's characters")
         
@@ -189,12 +187,12 @@ def apply_blocker(game: GameState, battle: Battle, blocker_id: str) -> None:
     defender = game.get_opponent()
     
     # Find blocker character
-    blocker = next((c for c in defender.characters if c.id == blocker_id), None)
+    blocker = defender.find_character(blocker_id)
     if not blocker:
         raise ValueError(f"Blocker {blocker_id} not found")
     
     # Verify blocker is ACTIVE (not already rested)
-    if defender.character_states.get(blocker_id) == CardState.RESTED:
+    if defender.character_states.get(blocker_id) is CardState.RESTED:
         raise ValueError("Blocker must be ACTIVE (not rested)")
     
     # Redirect attack to blocker
@@ -230,10 +228,10 @@ def apply_counter(game: GameState, battle: Battle, counter_card: Event, target_i
     defender = game.get_opponent()
     
     # Remove counter card from hand and put in trash
-    if counter_card not in defender.hand:
-        raise ValueError("Counter card not in hand")
-    
-    defender.hand.remove(counter_card)
+    try:
+        defender.hand.remove(counter_card)
+    except ValueError:
+        raise ValueError("Counter card not in hand") from None
     defender.trash.append(counter_card)
     battle.counters_played.append(counter_card)
     
@@ -293,18 +291,17 @@ def resolve_battle(game: GameState, battle: Battle) -> str:
                 battle.damage_dealt = 1
         else:
             # Character takes damage - goes to trash
-            target_char = next((c for c in defender.characters if c.id == battle.current_target_id), None)
-            if target_char:
-                defender.characters.remove(target_char)
+            target_index = next(
+                (i for i, c in enumerate(defender.characters) if c.id == battle.current_target_id),
+                None
+            )
+            if target_index is not None:
+                target_char = defender.characters.pop(target_index)
                 defender.trash.append(target_char)
                 
-                # Remove attached DON!! from character
-                if battle.current_target_id in defender.attached_don:
-                    del defender.attached_don[battle.current_target_id]
-                
-                # Remove character state
-                if battle.current_target_id in defender.character_states:
-                    del defender.character_states[battle.current_target_id]
+                # Remove attached DON!! and character state
+                defender.attached_don.pop(target_char.id, None)
+                defender.character_states.pop(target_char.id, None)
                 
                 battle.damage_dealt = 1
     else:
@@ -5,14 +5,18 @@ This module orchestrates the entire game flow, managing turns, phases,
 and action execution for both human and AI players.
 """
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Protocol, Optional
+from typing import Iterable, Protocol, Optional
 from enum import Enum
 
-from src.engine.game_state import GameState, Phase, CardState
-from src.engine.actions import Action, ActionType
+from src.engine.game_state import GameState, Phase
+from src.engine.actions import (
+    Action, ActionType, AttachDonAction, AttackAction, PassPhaseAction, PlayCardAction,
+)
+from src.engine.interactive_battle import execute_interactive_battle
 from src.engine.rules import validate_action
-from src.models import Leader
+from src.models import Character, Event, Leader
 
 
 class GameResult(Enum):
@@ -22,6 +26,10 @@ class GameResult(Enum):
     DRAW = "draw"
 
 
+# Result by which players are out: bit 0 = player 1, bit 1 = player 2
+_OUTCOMES = (None, GameResult.PLAYER_2_WIN, GameResult.PLAYER_1_WIN, GameResult.DRAW)
+
+
 class Player(Protocol):
     """
     Interface for game players (human or AI).
@@ -50,6 +58,7 @@ class GameConfig:
     player1_leader: Leader
     player2_leader: Leader
     starting_player: int = 1  # Which player goes first (1 or 2)
+    history_len: Optional[int] = None  # Actions kept in history (None = all)
 
 
 class Game:
@@ -75,8 +84,9 @@ class Game:
         # Initialize game state (will be done in separate method)
         self.state: Optional[GameState] = None
         
-        # Track game history
-        self.action_history: list[Action] = []
+        # Track game history (only the most recent history_len actions
+        # when set, so long self-play runs keep a fixed footprint)
+        self.action_history: deque[Action] = deque(maxlen=config.history_len)
         self.turn_count = 0
     
     def initialize_game(self) -> None:
@@ -111,6 +121,28 @@ class Game:
             # Increment turn counter
             self.turn_count += 1
     
+    def run_scripted(self, actions: Iterable[Action]) -> int:
+        """
+        Execute a fixed sequence of actions, e.g. to replay a recorded game.
+        
+        Scripted runs skip the Player.get_action() round trip and feed
+        each action straight to execute_action(). Execution stops at the
+        first action that fails.
+        
+        Args:
+            actions: Actions to execute, in order
+            
+        Returns:
+            Number of actions executed successfully
+        """
+        executed = 0
+        execute = self.execute_action
+        for action in actions:
+            if not execute(action):
+                break
+            executed += 1
+        return executed
+    
     def process_turn(self) -> None:
         """
         Execute one complete turn for the current player.
@@ -159,17 +191,11 @@ class Game:
         self.action_history.append(action)
         
         # Execute based on action type
-        if action.action_type == ActionType.PLAY_CARD:
-            return self._execute_play_card(action)
-        elif action.action_type == ActionType.ATTACK:
-            return self._execute_attack(action)
-        elif action.action_type == ActionType.ATTACH_DON:
-            return self._execute_attach_don(action)
-        elif action.action_type == ActionType.PASS_PHASE:
-            return self._execute_pass_phase(action)
-        else:
+        handler = self._ACTION_HANDLERS.get(action.action_type)
+        if handler is None:
             print(f"Unimplemented action type: {action.action_type}")
             return False
+        return handler(self, action)
     
     def _check_win_condition(self) -> Optional[GameResult]:
         """
@@ -178,26 +204,23 @@ class Game:
         Returns:
             GameResult if game is over, None if game continues
         """
+        # Not cached behind a dirty flag: the check is four truthiness
+        # tests, no cheaper than testing a flag, and life/deck zones are
+        # changed from many places (battles, draws, tests) that a flag
+        # would all have to track.
         if self.state is None:
             return None
         
+        player1 = self.state.player1
+        player2 = self.state.player2
+        
         # Check if either player has 0 life_cards
-        if len(self.state.player1.life_cards) <= 0 and len(self.state.player2.life_cards) <= 0:
-            return GameResult.DRAW
-        elif len(self.state.player1.life_cards) <= 0:
-            return GameResult.PLAYER_2_WIN
-        elif len(self.state.player2.life_cards) <= 0:
-            return GameResult.PLAYER_1_WIN
+        out_of_life = (not player1.life_cards) | ((not player2.life_cards) << 1)
+        if out_of_life:
+            return _OUTCOMES[out_of_life]
         
         # Check if either player has no cards in deck (deck-out loss)
-        if len(self.state.player1.deck) == 0 and len(self.state.player2.deck) == 0:
-            return GameResult.DRAW
-        elif len(self.state.player1.deck) == 0:
-            return GameResult.PLAYER_2_WIN
-        elif len(self.state.player2.deck) == 0:
-            return GameResult.PLAYER_1_WIN
-        
-        return None
+        return _OUTCOMES[(not player1.deck) | ((not player2.deck) << 1)]
     
     def _handle_refresh_phase(self) -> None:
         """Handle automatic REFRESH phase."""
@@ -205,7 +228,7 @@ class Game:
             return
         
         # Advance to REFRESH phase if not already there
-        if self.state.current_phase != Phase.REFRESH:
+        if self.state.current_phase is not Phase.REFRESH:
             self.state.advance_phase()
         
         # refresh_don() is called automatically by advance_phase()
@@ -221,7 +244,9 @@ class Game:
         
         # Draw 1 card (unless first turn of game)
         if self.turn_count > 0:
-            if len(current_player.deck) > 0:
+            if current_player.deck:
+                # Top of deck is index 0. pop(0) shifts at most ~50
+                # pointers, so the deck stays a plain (sliceable) list.
                 card = current_player.deck.pop(0)
                 current_player.hand.append(card)
         
@@ -248,13 +273,12 @@ class Game:
         current_player_obj = self.player1 if self.state.active_player_id == self.state.player1.player_id else self.player2
         
         # Loop until player passes
-        while self.state.current_phase == Phase.MAIN:
+        while self.state.current_phase is Phase.MAIN:
             # Request action from player
             action = current_player_obj.get_action(self.state)
             
             if action is None:
                 # Player wants to pass
-                from src.engine.actions import PassPhaseAction
                 action = PassPhaseAction(player_id=self.state.active_player_id)
             
             # Execute the action
@@ -285,7 +309,6 @@ class Game:
         if self.state is None:
             return False
         
-        from src.engine.actions import PlayCardAction
         if not isinstance(action, PlayCardAction):
             return False
         
@@ -294,31 +317,28 @@ class Game:
         # Get card from action
         card = action.card
         
-        # Remove card from hand
-        if card not in current_player.hand:
-            return False
-        current_player.hand.remove(card)
-        
-        # Pay DON!! cost - rest that many DON!!
+        # Check the DON!! cost before touching the hand
         cost = action.don_to_rest
         if current_player.active_don < cost:
             # Shouldn't happen (validation should catch), but safety check
-            current_player.hand.append(card)  # Return card to hand
             return False
         
+        # Remove card from hand (one scan: remove() fails if it's absent)
+        try:
+            current_player.hand.remove(card)
+        except ValueError:
+            return False
+        
+        # Pay DON!! cost - rest that many DON!!
         current_player.active_don -= cost
         
         # Add card to appropriate zone
-        from src.models import Character, Event
         if isinstance(card, Character):
-            # Add to field
-            current_player.characters.append(card)
+            # Add to field (initialized as ACTIVE)
+            current_player.add_character(card)
             
             # Track for summoning sickness
             current_player.played_this_turn.add(card.id)
-            
-            # Initialize as ACTIVE
-            current_player.character_states[card.id] = CardState.ACTIVE
         elif isinstance(card, Event):
             # Events go directly to trash after resolving
             current_player.trash.append(card)
@@ -338,9 +358,6 @@ class Game:
         if self.state is None:
             return False
         
-        from src.engine.actions import AttackAction
-        from src.engine.interactive_battle import execute_interactive_battle
-        
         if not isinstance(action, AttackAction):
             return False
         
@@ -376,7 +393,6 @@ class Game:
         if self.state is None:
             return False
         
-        from src.engine.actions import AttachDonAction
         if not isinstance(action, AttachDonAction):
             return False
         
@@ -387,12 +403,7 @@ class Game:
             return False
         
         # Move DON!! from active to attached
-        current_player.active_don -= action.don_count
-        
-        # Increment attached_don for target
-        if action.target_id not in current_player.attached_don:
-            current_player.attached_don[action.target_id] = 0
-        current_player.attached_don[action.target_id] += action.don_count
+        current_player.attach_don(action.target_id, action.don_count)
         
         return True
     
@@ -404,6 +415,14 @@ class Game:
         # Just advance to next phase
         self.state.advance_phase()
         return True
+    
+    # execute_action() dispatch table: action type -> handler
+    _ACTION_HANDLERS = {
+        ActionType.PLAY_CARD: _execute_play_card,
+        ActionType.ATTACK: _execute_attack,
+        ActionType.ATTACH_DON: _execute_attach_don,
+        ActionType.PASS_PHASE: _execute_pass_phase,
+    }
 
 
 
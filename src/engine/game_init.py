@@ -7,25 +7,33 @@ placing leaders, setting up DON!! decks, and preparing life cards.
 
 import random
 from uuid import uuid4
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from ..models import Deck, Leader, AnyCard
 from .game_state import GameState, PlayerState
 
 
-def shuffle_deck(cards: List[AnyCard]) -> List[AnyCard]:
+def shuffle_deck(cards: List[AnyCard], rng: Optional[np.random.Generator] = None) -> List[AnyCard]:
     """
     Shuffle a list of cards.
     
     Args:
         cards: List of cards to shuffle
+        rng: NumPy generator to shuffle with (default: the random
+            module, so random.seed() applies)
         
     Returns:
         Shuffled list of cards (new list, original unchanged)
     """
-    shuffled = cards.copy()
-    random.shuffle(shuffled)
-    return shuffled
+    if rng is None:
+        # Building a NumPy generator per call costs more than the
+        # shuffle itself, so the default path stays on random.shuffle()
+        shuffled = cards.copy()
+        random.shuffle(shuffled)
+        return shuffled
+    return [cards[i] for i in rng.permutation(len(cards))]
 
 
 def create_don_deck() -> List[str]:
@@ -46,7 +54,8 @@ def initialize_game(
     player2_name: str,
     player1_deck: Deck,
     player2_deck: Deck,
-    starting_player: int = 1
+    starting_player: int = 1,
+    rng: Optional[np.random.Generator] = None
 ) -> GameState:
     """
     Initialize a new One Piece TCG game.
@@ -65,6 +74,8 @@ def initialize_game(
         player1_deck: Player 1's deck (must be valid)
         player2_deck: Player 2's deck (must be valid)
         starting_player: Which player goes first (1 or 2)
+        rng: NumPy generator for the deck shuffles (default: the random
+            module, so random.seed() makes the deal reproducible)
         
     Returns:
         Initialized GameState ready to play
@@ -100,10 +111,10 @@ def initialize_game(
     )
     
     # Setup player 1
-    _setup_player(player1, player1_deck)
+    _setup_player(player1, player1_deck, rng)
     
     # Setup player 2
-    _setup_player(player2, player2_deck)
+    _setup_player(player2, player2_deck, rng)
     
     # Create game state
     game = GameState(
@@ -116,16 +127,17 @@ def initialize_game(
     return game
 
 
-def _setup_player(player: PlayerState, deck: Deck):
+def _setup_player(player: PlayerState, deck: Deck, rng: Optional[np.random.Generator]):
     """
     Set up a player's zones at game start.
     
     Args:
         player: PlayerState to set up
         deck: Deck to use for setup
+        rng: NumPy generator for the shuffle, or None for the random module
     """
     # Shuffle the main deck
-    shuffled_cards = shuffle_deck(deck.cards)
+    shuffled_cards = shuffle_deck(deck.cards, rng)
     
     # Set aside life cards (top X cards where X = leader's life)
     life_count = player.leader.life
@@ -150,7 +162,7 @@ def _setup_player(player: PlayerState, deck: Deck):
     player.attached_don = {}
 
 
-def mulligan(player: PlayerState) -> bool:
+def mulligan(player: PlayerState, rng: Optional[np.random.Generator] = None) -> bool:
     """
     Perform a mulligan (redraw starting hand).
     
@@ -159,6 +171,8 @@ def mulligan(player: PlayerState) -> bool:
     
     Args:
         player: Player performing the mulligan
+        rng: NumPy generator for the reshuffle (default: the random
+            module, so random.seed() applies)
         
     Returns:
         True if mulligan was performed
@@ -166,20 +180,43 @@ def mulligan(player: PlayerState) -> bool:
     if not player.hand:
         return False
     
-    # Put hand back into deck
-    player.deck.extend(player.hand)
-    player.hand = []
-    
-    # Shuffle deck
-    player.deck = shuffle_deck(player.deck)
-    
-    # Draw new hand (5 cards)
-    player.hand = player.deck[:5]
-    player.deck = player.deck[5:]
+    # Put hand back into deck and shuffle. The whole deck is reordered
+    # (later draws depend on it), so this can't be cut down to sampling
+    # just the 5 new cards.
+    cards = player.deck + player.hand
+    if rng is None:
+        random.shuffle(cards)
+        player.hand = cards[:5]
+        player.deck = cards[5:]
+        return True
+    order = rng.permutation(len(cards))
+    
+    # Draw new hand (5 cards) straight from the shuffled order
+    player.hand = [cards[i] for i in order[:5]]
+    player.deck = [cards[i] for i in order[5:]]
     
     return True
 
 
+_SUMMARY_RULE = "═══════════════════════════════════════════"
+_PLAYER_BOX_BOTTOM = "└────────────────────────────────────┘"
+
+
+def _player_summary_lines(player: PlayerState) -> List[str]:
+    """Format one player's box for get_game_summary()."""
+    leader = player.leader
+    return [
+        f"┌─ {player.name} ─────────────────────┐",
+        f"│ Leader: {leader.name if leader else 'None'}",
+        f"│ Life: {len(player.life_cards)}/{leader.life if leader else 0}",
+        f"│ Hand: {len(player.hand)} cards",
+        f"│ Deck: {len(player.deck)} cards",
+        f"│ DON!!: {player.active_don}/{player.don_pool}",
+        f"│ Field: {len(player.characters)} characters, {len(player.stages)} stages",
+        _PLAYER_BOX_BOTTOM,
+    ]
+
+
 def get_game_summary(game: GameState) -> str:
     """
     Get a detailed summary of the current game state.
@@ -191,37 +228,24 @@ def get_game_summary(game: GameState) -> str:
         Multi-line string describing the game state
     """
     lines = [
-        f"═══════════════════════════════════════════",
+        _SUMMARY_RULE,
         f"  ONE PIECE TCG - Game {game.game_id[:8]}",
-        f"═══════════════════════════════════════════",
-        f"",
+        _SUMMARY_RULE,
+        "",
         f"Turn {game.current_turn} - {game.current_phase.value.upper()} Phase",
         f"Active Player: {game.get_active_player().name}",
-        f"",
-        f"┌─ {game.player1.name} ─────────────────────┐",
-        f"│ Leader: {game.player1.leader.name if game.player1.leader else 'None'}",
-        f"│ Life: {len(game.player1.life_cards)}/{game.player1.leader.life if game.player1.leader else 0}",
-        f"│ Hand: {len(game.player1.hand)} cards",
-        f"│ Deck: {len(game.player1.deck)} cards",
-        f"│ DON!!: {game.player1.active_don}/{game.player1.don_pool}",
-        f"│ Field: {len(game.player1.characters)} characters, {len(game.player1.stages)} stages",
-        f"└────────────────────────────────────┘",
-        f"",
-        f"┌─ {game.player2.name} ─────────────────────┐",
-        f"│ Leader: {game.player2.leader.name if game.player2.leader else 'None'}",
-        f"│ Life: {len(game.player2.life_cards)}/{game.player2.leader.life if game.player2.leader else 0}",
-        f"│ Hand: {len(game.player2.hand)} cards",
-        f"│ Deck: {len(game.player2.deck)} cards",
-        f"│ DON!!: {game.player2.active_don}/{game.player2.don_pool}",
-        f"│ Field: {len(game.player2.characters)} characters, {len(game.player2.stages)} stages",
-        f"└────────────────────────────────────┘",
+        "",
+        *_player_summary_lines(game.player1),
+        "",
+        *_player_summary_lines(game.player2),
     ]
     
-    if game.is_game_over():
-        winner = game.get_winner()
+    # Every game-over condition has a winner (see GameState.get_winner)
+    winner = game.get_winner()
+    if winner is not None:
         lines.extend([
-            f"",
-            f"🏆 GAME OVER! Winner: {winner.name if winner else 'Draw'}",
+            "",
+            f"🏆 GAME OVER! Winner: {winner.name}",
         ])
     
     return "\n".join(lines)
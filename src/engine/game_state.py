@@ -46,6 +46,16 @@ class Phase(Enum):
     END = "end"             # End turn, trigger end-of-turn effects
 
 
+# Turn order within a turn; END wraps to the next player's REFRESH.
+# Enum members are singletons, so phases are compared with "is".
+_NEXT_PHASE = {
+    Phase.REFRESH: Phase.DRAW,
+    Phase.DRAW: Phase.DON,
+    Phase.DON: Phase.MAIN,
+    Phase.MAIN: Phase.END,
+}
+
+
 class CardState(Enum):
     """State of a card in play."""
     ACTIVE = "active"       # Untapped/ready (vertical)
@@ -53,7 +63,7 @@ class CardState(Enum):
     ATTACHED = "attached"   # DON!! attached to a card
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """
     Represents one player's state in the game.
@@ -68,10 +78,14 @@ class PlayerState:
     # Leader area (center top)
     leader: Optional[Leader] = None
     leader_state: CardState = CardState.ACTIVE  # Leader can be ACTIVE or RESTED (after attacking)
-    life_cards: List[Card] = field(default_factory=list)  # Face-down cards under leader
+    # Face-down cards under leader. These are real cards, not a counter:
+    # taking damage moves the top one into the hand (see battle.py).
+    life_cards: List[Card] = field(default_factory=list)
     defeated: bool = False  # True when leader takes damage at 0 life (loses the game)
     
     # Character area (field - up to 5 characters max in official rules)
+    # Per-character state is keyed by card id rather than field slot:
+    # characters leave the field from any position, so slots would shift.
     characters: List[Character] = field(default_factory=list)
     character_states: Dict[str, CardState] = field(default_factory=dict)  # card_id -> state
     
@@ -79,7 +93,8 @@ class PlayerState:
     stages: List[Stage] = field(default_factory=list)
     stage_states: Dict[str, CardState] = field(default_factory=dict)
     
-    # Hand zone
+    # Hand zone (ordered; kept a list since hands stay around ten cards,
+    # so playing a card is a single short scan in hand.remove())
     hand: List[AnyCard] = field(default_factory=list)
     
     # Deck zone (main deck, face-down)
@@ -94,7 +109,8 @@ class PlayerState:
     active_don: int = 0  # DON!! available to spend this turn
     attached_don: Dict[str, int] = field(default_factory=dict)  # card_id -> DON!! count
     
-    # Summoning sickness tracking
+    # Summoning sickness tracking (by card id, like character_states;
+    # ids cache their string hash, so membership is one set probe)
     played_this_turn: set = field(default_factory=set)  # card_ids played this turn (can't attack)
     first_turn: bool = True  # True on player's first turn (all characters have summoning sickness)
     
@@ -107,13 +123,13 @@ class PlayerState:
     
     def get_total_power(self) -> int:
         """Calculate total power of all active characters and leader."""
+        # Computed on demand, not cached: characters and attached_don are
+        # plain containers that callers (and tests) modify directly.
         total = self.leader.power if self.leader else 0
-        for char in self.characters:
-            # Add character power + attached DON!! bonuses
-            total += char.power
-            if char.id in self.attached_don:
-                total += self.attached_don[char.id] * 1000  # Each DON!! = +1000 power
-        return total
+        attached = self.attached_don.get
+        # Character power + attached DON!! bonuses (each DON!! = +1000 power)
+        return total + sum([char.power + attached(char.id, 0) * 1000
+                            for char in self.characters])
     
     def get_field_card_count(self) -> int:
         """Get total number of cards on the field."""
@@ -122,6 +138,126 @@ class PlayerState:
     def is_field_full(self) -> bool:
         """Check if character area is full (5 characters max)."""
         return len(self.characters) >= 5
+
+    def add_character(self, card: Character, state: CardState = CardState.ACTIVE) -> None:
+        """
+        Place a character on the field and record its state.
+
+        Args:
+            card: The character entering the field
+            state: Initial state of the character (ACTIVE by default)
+        """
+        self.characters.append(card)
+        self.character_states[card.id] = state
+
+    def find_character(self, card_id: str) -> Optional[Character]:
+        """
+        Find a character on the field by card id.
+        
+        A plain scan of at most five cards; no id index is kept, since
+        characters is a list that callers may modify directly.
+        
+        Returns:
+            The character, or None if it is not on the field
+        """
+        for char in self.characters:
+            if char.id == card_id:
+                return char
+        return None
+    
+    def find_in_hand(self, card_id: str) -> Optional[AnyCard]:
+        """
+        Find a card in hand by card id.
+        
+        Comparing ids avoids the field-by-field dataclass __eq__ that a
+        `card in hand` check runs against every card it passes.
+        
+        Returns:
+            The card, or None if it is not in hand
+        """
+        for card in self.hand:
+            if card.id == card_id:
+                return card
+        return None
+    
+    def attach_don(self, card_id: str, count: int = 1) -> None:
+        """
+        Move DON!! from the active pool onto a card.
+        
+        Args:
+            card_id: ID of the receiving card ("leader" for the leader)
+            count: Number of DON!! to attach
+        """
+        self.active_don -= count
+        self.attached_don[card_id] = self.attached_don.get(card_id, 0) + count
+
+    def clone(self) -> "PlayerState":
+        """
+        Copy this player state for simulation.
+        
+        Cards are immutable, so they are shared; only the zone containers
+        are copied. Much cheaper than copy.deepcopy(). The containers are
+        copied eagerly rather than copy-on-write, because the engine and
+        AIs mutate zones in place from many call sites.
+        
+        Fields are assigned directly, skipping the generated __init__
+        (about half the cost of a clone). Every field must be listed here;
+        test_clone checks this.
+        """
+        new = object.__new__(PlayerState)
+        new.player_id = self.player_id
+        new.name = self.name
+        new.leader = self.leader
+        new.leader_state = self.leader_state
+        new.life_cards = list(self.life_cards)
+        new.defeated = self.defeated
+        new.characters = list(self.characters)
+        new.character_states = dict(self.character_states)
+        new.stages = list(self.stages)
+        new.stage_states = dict(self.stage_states)
+        new.hand = list(self.hand)
+        new.deck = list(self.deck)
+        new.trash = list(self.trash)
+        new.don_deck = list(self.don_deck)
+        new.don_pool = self.don_pool
+        new.active_don = self.active_don
+        new.attached_don = dict(self.attached_don)
+        new.played_this_turn = set(self.played_this_turn)
+        new.first_turn = self.first_turn
+        return new
+    
+    def canonical_key(self) -> tuple:
+        """
+        Return a hashable key identifying this player's position.
+        
+        Meant for comparing states derived from one common ancestor, as
+        in a search tree. Visible zones are keyed by card id in order
+        (legal actions are generated in zone order) and per-card state
+        follows field order. Face-down zones only ever lose cards from
+        the top, so within one search their size identifies them.
+        """
+        characters = self.characters
+        states = self.character_states
+        stage_states = self.stage_states
+        return (
+            self.leader.id if self.leader else None,
+            self.leader_state,
+            len(self.life_cards),
+            self.defeated,
+            tuple([char.id for char in characters]),
+            tuple([states.get(char.id) for char in characters]),
+            tuple([stage.id for stage in self.stages]),
+            tuple([stage_states.get(stage.id) for stage in self.stages]),
+            tuple([card.id for card in self.hand]),
+            len(self.deck),
+            len(self.trash),
+            len(self.don_deck),
+            self.don_pool,
+            self.active_don,
+            tuple(sorted(self.attached_don.items())),
+            frozenset(self.played_this_turn),
+            self.first_turn,
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert player state to dictionary."""
@@ -144,7 +280,7 @@ class PlayerState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """
     Represents the complete state of a One Piece TCG game.
@@ -202,19 +338,19 @@ class GameState:
         player.active_don += total_detached
         
         # Step 2: Add 2 more DON!! from don_deck to don_pool (max 10 total)
-        don_to_add = min(2, len(player.don_deck))  # Can't add more than we have
-        don_to_add = min(don_to_add, 10 - player.don_pool)  # Can't exceed 10 total
+        # Can't add more than we have, or exceed 10 total
+        don_to_add = max(0, min(2, len(player.don_deck), 10 - player.don_pool))
         
-        for _ in range(don_to_add):
-            if player.don_deck:
-                player.don_deck.pop()  # Remove from don_deck
-                player.don_pool += 1
-                player.active_don += 1
+        # Take them off the top (end) of the don_deck in one slice
+        del player.don_deck[len(player.don_deck) - don_to_add:]
+        player.don_pool += don_to_add
+        player.active_don += don_to_add
         
         # Step 3: Untap all characters AND leader (set to ACTIVE)
         player.leader_state = CardState.ACTIVE
-        for char_id in player.character_states:
-            player.character_states[char_id] = CardState.ACTIVE
+        player.character_states.update(
+            dict.fromkeys(player.character_states, CardState.ACTIVE)
+        )
         
         # Step 4: Clear summoning sickness and first turn flag
         player.played_this_turn.clear()
@@ -222,10 +358,7 @@ class GameState:
     
     def advance_phase(self):
         """Move to the next phase of the turn."""
-        phase_order = [Phase.REFRESH, Phase.DRAW, Phase.DON, Phase.MAIN, Phase.END]
-        current_index = phase_order.index(self.current_phase)
-        
-        if current_index == len(phase_order) - 1:
+        if self.current_phase is Phase.END:
             # End of turn - switch players and go to next turn
             self.switch_active_player()
             self.current_turn += 1
@@ -233,12 +366,7 @@ class GameState:
             # Refresh DON!! for the new active player
             self.refresh_don(self.get_active_player())
         else:
-            # Moving to REFRESH phase mid-turn (shouldn't normally happen, but handle it)
-            if self.current_phase == Phase.END and phase_order[current_index + 1] == Phase.REFRESH:
-                self.current_phase = Phase.REFRESH
-                self.refresh_don(self.get_active_player())
-            else:
-                self.current_phase = phase_order[current_index + 1]
+            self.current_phase = _NEXT_PHASE[self.current_phase]
     
     def is_game_over(self) -> bool:
         """
@@ -248,13 +376,17 @@ class GameState:
         - A player's leader is defeated (takes damage when at 0 life)
         - A player cannot draw a card when required (deck out)
         """
+        # Computed on demand rather than kept in cached flags: these are
+        # four attribute/truthiness reads, and zones are reassigned
+        # directly in many places (mulligan, tests, clone()), so a flag
+        # maintained by mutators could silently go stale.
         # Game ends when a leader is defeated (not just at 0 life!)
         # In One Piece TCG, you can be at 0 life but still playing - 
         # you lose when you take damage WHILE at 0 life
         return (self.player1.defeated or 
                 self.player2.defeated or
-                len(self.player1.deck) == 0 or  # Deck out
-                len(self.player2.deck) == 0)
+                not self.player1.deck or  # Deck out
+                not self.player2.deck)
     
     def get_winner(self) -> Optional[PlayerState]:
         """
@@ -262,9 +394,7 @@ class GameState:
         
         Returns the player who has NOT been defeated.
         """
-        if not self.is_game_over():
-            return None
-        
+        # These are the is_game_over() conditions, checked one by one
         # Player who is defeated loses
         if self.player1.defeated:
             return self.player2
@@ -272,15 +402,38 @@ class GameState:
             return self.player1
         
         # Player who decked out loses
-        if len(self.player1.deck) == 0:
+        if not self.player1.deck:
             return self.player2
-        if len(self.player2.deck) == 0:
+        if not self.player2.deck:
             return self.player1
         
         return None
     
+    def clone(self) -> "GameState":
+        """Copy this game state for simulation (see PlayerState.clone())."""
+        return GameState(
+            game_id=self.game_id,
+            player1=self.player1.clone(),
+            player2=self.player2.clone(),
+            current_turn=self.current_turn,
+            active_player_id=self.active_player_id,
+            current_phase=self.current_phase,
+            turn_history=list(self.turn_history),
+        )
+    
+    def canonical_key(self) -> tuple:
+        """Return a hashable key identifying this position (see PlayerState.canonical_key())."""
+        return (
+            self.current_phase,
+            self.current_turn,
+            self.active_player_id,
+            self.player1.canonical_key(),
+            self.player2.canonical_key(),
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert game state to dictionary."""
+        winner = self.get_winner()
         return {
             "game_id": self.game_id,
             "player1": self.player1.to_dict(),
@@ -288,8 +441,8 @@ class GameState:
             "current_turn": self.current_turn,
             "active_player_id": self.active_player_id,
             "current_phase": self.current_phase.value,
-            "is_game_over": self.is_game_over(),
-            "winner": self.get_winner().name if self.get_winner() else None,
+            "is_game_over": winner is not None,
+            "winner": winner.name if winner else None,
         }
     
     def to_json(self) -> str:
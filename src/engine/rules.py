@@ -39,21 +39,16 @@ def validate_action(game: GameState, action: Action) -> tuple[bool, Optional[str
         if action.player_id != game.active_player_id:
             return (False, "Not your turn")
         
-        # Validate based on action type
-        if action.action_type == ActionType.PLAY_CARD:
-            return _validate_play_card(game, action)
-        elif action.action_type == ActionType.ATTACK:
-            return _validate_attack(game, action)
-        elif action.action_type == ActionType.ATTACH_DON:
-            return _validate_attach_don(game, action)
-        elif action.action_type == ActionType.USE_COUNTER:
-            return _validate_use_counter(game, action)
-        elif action.action_type == ActionType.USE_BLOCKER:
-            return _validate_use_blocker(game, action)
-        elif action.action_type == ActionType.PASS_PHASE:
-            return _validate_pass_phase(game, action)
-        else:
-            return (True, None)  # Other actions are always valid
+        # Check the phase gate before any per-action rules
+        gate = _PHASE_GATES.get(action.action_type)
+        if gate is not None and game.current_phase not in gate[0]:
+            return (False, gate[1].format(phase=game.current_phase.value))
+        
+        # Validate based on action type; other actions are always valid
+        validator = _VALIDATORS.get(action.action_type)
+        if validator is None:
+            return (True, None)
+        return validator(game, action)
             
     except ValidationError as e:
         return (False, str(e))
@@ -63,12 +58,8 @@ def _validate_play_card(game: GameState, action: PlayCardAction) -> tuple[bool,
     """Validate playing a card from hand."""
     player = game.get_active_player()
     
-    # Must be in MAIN phase
-    if game.current_phase != Phase.MAIN:
-        return (False, "Can only play cards during MAIN phase")
-    
     # Card must be in hand
-    if action.card not in player.hand:
+    if player.find_in_hand(action.card.id) is None:
         return (False, "Card not in hand")
     
     # Must have enough active DON!! to pay cost
@@ -103,10 +94,6 @@ def _validate_attack(game: GameState, action: AttackAction) -> tuple[bool, Optio
     attacker = game.get_active_player()
     defender = game.get_opponent()
     
-    # Must be in MAIN phase
-    if game.current_phase != Phase.MAIN:
-        return (False, "Can only attack during MAIN phase")
-    
     # Validate attacker
     if action.is_leader_attack:
         # Leaders can attack
@@ -115,12 +102,12 @@ def _validate_attack(game: GameState, action: AttackAction) -> tuple[bool, Optio
             return (False, "Cannot attack on your first turn")
     else:
         # Find attacker character
-        attacker_char = next((c for c in attacker.characters if c.id == action.attacker_id), None)
+        attacker_char = attacker.find_character(action.attacker_id)
         if not attacker_char:
             return (False, "Attacker not found")
         
         # Attacker must be ACTIVE (not rested)
-        if attacker.character_states.get(action.attacker_id) == CardState.RESTED:
+        if attacker.character_states.get(action.attacker_id) is CardState.RESTED:
             return (False, "Attacker is already rested")
         
         # Check for summoning sickness (played this turn or first turn)
@@ -144,11 +131,11 @@ def _validate_attack(game: GameState, action: AttackAction) -> tuple[bool, Optio
         pass
     else:
         # Attacking a character - must be RESTED
-        target_char = next((c for c in defender.characters if c.id == action.target_id), None)
+        target_char = defender.find_character(action.target_id)
         if not target_char:
             return (False, "Target not found")
         
-        if defender.character_states.get(action.target_id) != CardState.RESTED:
+        if defender.character_states.get(action.target_id) is not CardState.RESTED:
             return (False, "Can only attack RESTED characters")
     
     return (True, None)
@@ -158,10 +145,6 @@ def _validate_attach_don(game: GameState, action: AttachDonAction) -> tuple[bool
     """Validate attaching DON!! to a card."""
     player = game.get_active_player()
     
-    # Must be in DON phase
-    if game.current_phase != Phase.DON:
-        return (False, "Can only attach DON!! during DON phase")
-    
     # Must have enough active DON!!
     if action.don_count > player.active_don:
         return (False, f"Not enough active DON!! (need {action.don_count}, have {player.active_don})")
@@ -171,7 +154,7 @@ def _validate_attach_don(game: GameState, action: AttachDonAction) -> tuple[bool
         if not player.leader:
             return (False, "No leader to attach DON!! to")
     else:
-        target_char = next((c for c in player.characters if c.id == action.target_id), None)
+        target_char = player.find_character(action.target_id)
         if not target_char:
             return (False, "Target character not found")
     
@@ -187,7 +170,7 @@ def _validate_use_counter(game: GameState, action: UseCounterAction) -> tuple[bo
         return (False, "Can only use counters on opponent's turn")
     
     # Card must be in hand
-    if action.counter_card not in player.hand:
+    if player.find_in_hand(action.counter_card.id) is None:
         return (False, "Counter card not in hand")
     
     # Card must have counter value
@@ -209,12 +192,12 @@ def _validate_use_blocker(game: GameState, action: UseBlockerAction) -> tuple[bo
         return (False, "Can only use blockers on opponent's turn")
     
     # Find blocker character
-    blocker = next((c for c in player.characters if c.id == action.blocker_id), None)
+    blocker = player.find_character(action.blocker_id)
     if not blocker:
         return (False, "Blocker character not found")
     
     # Blocker must be ACTIVE (not rested)
-    if player.character_states.get(action.blocker_id) == CardState.RESTED:
+    if player.character_states.get(action.blocker_id) is CardState.RESTED:
         return (False, "Blocker must be ACTIVE (not rested)")
     
     # TODO: Verify blocker has the "Blocker" ability
@@ -227,15 +210,40 @@ def _validate_use_blocker(game: GameState, action: UseBlockerAction) -> tuple[bo
 
 
 def _validate_pass_phase(game: GameState, action: PassPhaseAction) -> tuple[bool, Optional[str]]:
-    """Validate passing the current phase."""
-    # Can only pass during MAIN or END phases
-    if game.current_phase not in [Phase.MAIN, Phase.END]:
-        return (False, f"Cannot manually pass {game.current_phase.value} phase")
-    
+    """Validate passing the current phase (phase gate checked by validate_action)."""
     return (True, None)
 
 
-def get_legal_actions(game: GameState, player_id: str) -> List[Action]:
+# Phases each action type may be taken in, with the error for any other
+# phase ({phase} is filled in with the current phase value)
+_PHASE_GATES = {
+    ActionType.PLAY_CARD: (frozenset({Phase.MAIN}), "Can only play cards during MAIN phase"),
+    ActionType.ATTACK: (frozenset({Phase.MAIN}), "Can only attack during MAIN phase"),
+    ActionType.ATTACH_DON: (frozenset({Phase.DON}), "Can only attach DON!! during DON phase"),
+    # REFRESH, DRAW and DON advance automatically
+    ActionType.PASS_PHASE: (frozenset({Phase.MAIN, Phase.END}), "Cannot manually pass {phase} phase"),
+}
+
+# Per-action-type validators used by validate_action
+_VALIDATORS = {
+    ActionType.PLAY_CARD: _validate_play_card,
+    ActionType.ATTACK: _validate_attack,
+    ActionType.ATTACH_DON: _validate_attach_don,
+    ActionType.USE_COUNTER: _validate_use_counter,
+    ActionType.USE_BLOCKER: _validate_use_blocker,
+    ActionType.PASS_PHASE: _validate_pass_phase,
+}
+
+
+def _is_counter_only_event(card: AnyCard) -> bool:
+    """Check if a card is an event that can only be played during battle."""
+    return (
+        isinstance(card, Event) and hasattr(card, 'counter')
+        and "[Counter]" in card.effect_text and "[Main]" not in card.effect_text
+    )
+
+
+def get_legal_actions(game: GameState, player_id: str, include_pass: bool = True) -> List[Action]:
     """
     Get all legal actions for a player in the current game state.
     
@@ -244,6 +252,8 @@ def get_legal_actions(game: GameState, player_id: str) -> List[Action]:
     Args:
         game: Current game state
         player_id: Player to get actions for
+        include_pass: Include the PASS_PHASE action (AIs that decide
+            separately when to pass set this to False)
         
     Returns:
         List of legal Action objects
@@ -258,54 +268,48 @@ def get_legal_actions(game: GameState, player_id: str) -> List[Action]:
     opponent = game.get_opponent()
     
     # Phase-specific actions
-    if game.current_phase == Phase.MAIN:
-        # Can play cards from hand
-        for card in player.hand:
-            if isinstance(card, (Character, Stage, Event)):
-                # Check if we can afford it
-                if card.cost <= player.active_don:
-                    # Skip counter-only events
-                    if isinstance(card, Event) and hasattr(card, 'counter'):
-                        if "[Counter]" in card.effect_text and "[Main]" not in card.effect_text:
-                            continue
-                    
-                    action = PlayCardAction(
-                        player_id=player_id,
-                        card=card,
-                        don_to_rest=card.cost,
-                        action_type=ActionType.PLAY_CARD
-                    )
-                    legal_actions.append(action)
+    if game.current_phase is Phase.MAIN:
+        # Can play affordable cards from hand (skipping counter-only events)
+        active_don = player.active_don
+        legal_actions.extend([
+            PlayCardAction(
+                player_id=player_id,
+                card=card,
+                don_to_rest=card.cost,
+                action_type=ActionType.PLAY_CARD
+            )
+            for card in player.hand
+            if isinstance(card, (Character, Stage, Event))
+            and card.cost <= active_don
+            and not _is_counter_only_event(card)
+        ])
         
-        # Can attack with ACTIVE characters
-        for char in player.characters:
-            if player.character_states.get(char.id) != CardState.RESTED:
-                # Can attack leader
-                action = AttackAction(
-                    player_id=player_id,
-                    attacker_id=char.id,
-                    target_id="leader",
-                    is_leader_attack=False,
-                    action_type=ActionType.ATTACK
-                )
-                legal_actions.append(action)
-                
-                # Can attack RESTED opponent characters
-                for opp_char in opponent.characters:
-                    if opponent.character_states.get(opp_char.id) == CardState.RESTED:
-                        action = AttackAction(
-                            player_id=player_id,
-                            attacker_id=char.id,
-                            target_id=opp_char.id,
-                            is_leader_attack=False,
-                            action_type=ActionType.ATTACK
-                        )
-                        legal_actions.append(action)
+        # Can attack the leader or RESTED opponent characters with ACTIVE
+        # characters; the targets are the same for every attacker
+        opp_states = opponent.character_states
+        targets = ["leader"] + [
+            opp_char.id for opp_char in opponent.characters
+            if opp_states.get(opp_char.id) is CardState.RESTED
+        ]
+        states = player.character_states
+        legal_actions.extend([
+            AttackAction(
+                player_id=player_id,
+                attacker_id=char.id,
+                target_id=target_id,
+                is_leader_attack=False,
+                action_type=ActionType.ATTACK
+            )
+            for char in player.characters
+            if states.get(char.id) is not CardState.RESTED
+            for target_id in targets
+        ])
         
         # Can pass phase
-        legal_actions.append(PassPhaseAction(player_id=player_id, action_type=ActionType.PASS_PHASE))
+        if include_pass:
+            legal_actions.append(PassPhaseAction(player_id=player_id, action_type=ActionType.PASS_PHASE))
     
-    elif game.current_phase == Phase.DON:
+    elif game.current_phase is Phase.DON:
         # Can attach DON!! to characters or leader
         if player.active_don > 0:
             # Attach to leader
@@ -12,15 +12,35 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from uuid import uuid4
 import json
+import sys
 
 
-@dataclass
+# Legal counter values for Characters and Events
+_VALID_COUNTERS = frozenset({0, 1000, 2000})
+
+
+def _intern_name(card: "Card") -> None:
+    """
+    Intern a new card's name.
+    
+    Copies of a card share one name string, so comparing or counting
+    by name (deck limits, lookups) mostly hits the identity fast path.
+    """
+    object.__setattr__(card, "name", sys.intern(card.name))
+
+
+@dataclass(slots=True, frozen=True)
 class Card:
     """
     Base card class representing a generic TCG card.
     
     All card types inherit from this base class. Uses dataclass for
     clean attribute definition and automatic __init__, __repr__, etc.
+    Cards are frozen, slotted value objects: they are never modified
+    after creation, so they are hashable and cheap to store. Use
+    dataclasses.replace() to derive a modified copy. Copies of the same
+    printed card stay separate objects with their own ids, because
+    field state (rested, attached DON!!) is tracked per id.
     
     Attributes:
         id: Unique identifier (UUID string)
@@ -42,6 +62,29 @@ class Card:
         
         if not self.name:
             raise ValueError("Card name cannot be empty")
+        _intern_name(self)
+    
+    def __hash__(self) -> int:
+        """
+        Hash by id alone.
+        
+        Ids are unique and equal cards share an id, so this agrees with
+        the field-wise __eq__ while skipping the all-fields tuple hash.
+        """
+        return hash(self.id)
+    
+    def __copy__(self) -> "Card":
+        """Cards are immutable, so a copy is the card itself."""
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Card":
+        """
+        Cards are immutable, so a deep copy is the card itself.
+        
+        This keeps copy.deepcopy() of a game state (e.g. the test
+        fixtures' per-test copies) from re-allocating every card.
+        """
+        return self
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -76,7 +119,7 @@ class Card:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Leader(Card):
     """
     Leader card - the centerpiece of your deck.
@@ -94,6 +137,8 @@ class Leader(Card):
     power: int = 5000
     life: int = 5
     card_type: str = field(default="Leader", init=False)
+    # Re-declared: @dataclass replaces an inherited __hash__ with a field hash
+    __hash__ = Card.__hash__
     
     def __post_init__(self):
         """Validate leader-specific attributes."""
@@ -102,6 +147,7 @@ class Leader(Card):
             raise ValueError(f"Cost must be between 0 and 10, got {self.cost}")
         if not self.name:
             raise ValueError("Card name cannot be empty")
+        _intern_name(self)
         
         if self.power < 0 or self.power > 13000:
             raise ValueError(f"Power must be between 0 and 13000, got {self.power}")
@@ -111,7 +157,7 @@ class Leader(Card):
     
     def to_dict(self) -> Dict[str, Any]:
         """Include leader-specific attributes in dictionary."""
-        data = super().to_dict()
+        data = Card.to_dict(self)
         data.update({
             "power": self.power,
             "life": self.life,
@@ -126,7 +172,7 @@ class Leader(Card):
         return cls(**filtered_data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Character(Card):
     """
     Character card - creatures that battle on the field.
@@ -144,6 +190,8 @@ class Character(Card):
     power: int = 1000
     counter: int = 1000
     card_type: str = field(default="Character", init=False)
+    # Re-declared: @dataclass replaces an inherited __hash__ with a field hash
+    __hash__ = Card.__hash__
     
     def __post_init__(self):
         """Validate character-specific attributes."""
@@ -151,16 +199,17 @@ class Character(Card):
             raise ValueError(f"Cost must be between 0 and 10, got {self.cost}")
         if not self.name:
             raise ValueError("Card name cannot be empty")
+        _intern_name(self)
         
         if self.power < 0 or self.power > 13000:
             raise ValueError(f"Power must be between 0 and 13000, got {self.power}")
         
-        if self.counter not in [0, 1000, 2000]:
+        if self.counter not in _VALID_COUNTERS:
             raise ValueError(f"Counter must be 0, 1000, or 2000, got {self.counter}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Include character-specific attributes in dictionary."""
-        data = super().to_dict()
+        data = Card.to_dict(self)
         data.update({
             "power": self.power,
             "counter": self.counter,
@@ -174,7 +223,7 @@ class Character(Card):
         return cls(**filtered_data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event(Card):
     """
     Event card - one-time effect cards.
@@ -190,6 +239,8 @@ class Event(Card):
     """
     counter: int = 0
     card_type: str = field(default="Event", init=False)
+    # Re-declared: @dataclass replaces an inherited __hash__ with a field hash
+    __hash__ = Card.__hash__
     
     def __post_init__(self):
         """Validate event-specific attributes."""
@@ -197,13 +248,14 @@ class Event(Card):
             raise ValueError(f"Cost must be between 0 and 10, got {self.cost}")
         if not self.name:
             raise ValueError("Card name cannot be empty")
+        _intern_name(self)
         
-        if self.counter not in [0, 1000, 2000]:
+        if self.counter not in _VALID_COUNTERS:
             raise ValueError(f"Counter must be 0, 1000, or 2000, got {self.counter}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Include event-specific attributes in dictionary."""
-        data = super().to_dict()
+        data = Card.to_dict(self)
         data.update({
             "counter": self.counter,
         })
@@ -216,7 +268,7 @@ class Event(Card):
         return cls(**filtered_data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Stage(Card):
     """
     Stage card - persistent field cards with ongoing effects.
@@ -231,6 +283,8 @@ class Stage(Card):
     implemented in the game engine later.
     """
     card_type: str = field(default="Stage", init=False)
+    # Re-declared: @dataclass replaces an inherited __hash__ with a field hash
+    __hash__ = Card.__hash__
     
     def __post_init__(self):
         """Validate stage-specific attributes."""
@@ -238,6 +292,7 @@ class Stage(Card):
             raise ValueError(f"Cost must be between 0 and 10, got {self.cost}")
         if not self.name:
             raise ValueError("Card name cannot be empty")
+        _intern_name(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Stage":
@@ -5,11 +5,18 @@ Represents a collection of cards with validation rules based on
 One Piece TCG deck construction requirements.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from uuid import uuid4
 import json
 
+# orjson is an optional, much faster drop-in for JSON encoding
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 from .card import Card, Leader, Character, Event, Stage, AnyCard, create_card_from_dict
 
 
@@ -61,6 +68,33 @@ class Deck:
         
         self.cards.append(card)
     
+    def add_cards(self, cards: Iterable[AnyCard]) -> None:
+        """
+        Add several cards to the deck at once.
+        
+        Counts existing copies in a single pass instead of rescanning the
+        deck for every card, so building a full deck is O(n) rather than
+        O(n²). Either all cards are added or none are.
+        
+        Args:
+            cards: The cards to add
+            
+        Raises:
+            ValueError: If adding would violate deck rules
+        """
+        new_cards = list(cards)
+        counts = self._count_names()
+        
+        for card in new_cards:
+            if isinstance(card, Leader):
+                raise ValueError("Cannot add leader to deck. Use set_leader() instead.")
+            
+            counts[card.name] += 1
+            if counts[card.name] > 4:
+                raise ValueError(f"Cannot add more than 4 copies of '{card.name}'")
+        
+        self.cards.extend(new_cards)
+    
     def set_leader(self, leader: Leader) -> None:
         """
         Set the deck's leader card.
@@ -116,11 +150,7 @@ class Deck:
             errors.append(f"Deck must have exactly 50 cards, has {len(self.cards)}")
         
         # Check for more than 4 copies of any card
-        card_counts: Dict[str, int] = {}
-        for card in self.cards:
-            card_counts[card.name] = card_counts.get(card.name, 0) + 1
-        
-        for card_name, count in card_counts.items():
+        for card_name, count in self._count_names().items():
             if count > 4:
                 errors.append(f"'{card_name}' has {count} copies (max 4 allowed)")
         
@@ -137,10 +167,17 @@ class Deck:
             counts = deck.get_card_counts()
             # {"Roronoa Zoro": 4, "Nami": 3, ...}
         """
-        counts: Dict[str, int] = {}
-        for card in self.cards:
-            counts[card.name] = counts.get(card.name, 0) + 1
-        return counts
+        return dict(self._count_names())
+    
+    def _count_names(self) -> Counter:
+        """
+        Count copies of each card name in a single pass.
+        
+        Always recounted: cards is a public list that callers change
+        directly, in place as well as by appending, so a cached count
+        could silently go stale.
+        """
+        return Counter(card.name for card in self.cards)
     
     def to_dict(self) -> Dict[str, any]:
         """
@@ -158,7 +195,9 @@ class Deck:
         }
     
     def to_json(self) -> str:
-        """Convert deck to JSON string."""
+        """Convert deck to JSON string (uses orjson when installed)."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
     
     @classmethod
@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for the TCG Deckhand test suite.
+"""
+
+import sqlite3
+from uuid import uuid4
+
+import pytest
+
+from src.db import init_database, close_all
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory):
+    """
+    Initialize a database once per test session.
+
+    Tests that need a fresh, empty database copy this file with
+    shutil.copyfile() instead of running the full schema DDL again.
+    """
+    path = tmp_path_factory.mktemp("db") / "template.db"
+    init_database(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def template_conn(template_db):
+    """
+    Hold the template database in memory for the whole session.
+    
+    memory_db clones from this connection, so each test copies pages
+    from memory instead of reopening and reading the template file.
+    """
+    conn = sqlite3.connect(":memory:")
+    source = sqlite3.connect(template_db)
+    source.backup(conn)
+    source.close()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def close_pooled_connections():
+    """Close any pooled database connections at the end of the session."""
+    yield
+    close_all()
+
+
+@pytest.fixture
+def memory_db(template_conn):
+    """
+    Provide a fresh, initialized in-memory database URI.
+    
+    The in-memory template is copied into a uniquely named shared-cache
+    in-memory database, so card/deck tests never touch the filesystem.
+    A keeper connection holds the database open for the whole test
+    (SQLite drops a memory database when its last connection closes).
+    Memory databases never touch the disk, so there is nothing to gain
+    from test-only durability settings (synchronous=OFF and the like).
+    """
+    uri = f"file:testdb_{uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    template_conn.backup(keeper)
+    
+    yield uri
+    
+    close_all()
+    keeper.close()
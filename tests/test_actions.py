@@ -91,6 +91,17 @@ class TestAttackAction:
         
         assert action.is_leader_attack is True
         assert "Leader" in str(action)
+    
+    def test_attack_action_uses_slots(self):
+        """Test that actions carry no per-instance __dict__."""
+        action = AttackAction(
+            player_id="player1",
+            attacker_id="char_123",
+            target_id="leader",
+            action_type=ActionType.ATTACK
+        )
+        
+        assert not hasattr(action, "__dict__")
 
 
 class TestAttachDonAction:
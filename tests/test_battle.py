@@ -4,6 +4,8 @@ Tests for battle system.
 Tests battle initiation, blocker phase, counter phase, and resolution.
 """
 
+import copy
+
 import pytest
 
 from src.models import Character, Event, Leader, Deck
@@ -14,7 +16,7 @@ from src.engine.battle import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_deck():
     """Create a valid 50-card deck for testing."""
     leader = Leader(name="Luffy", cost=0, power=5000, life=5)
@@ -22,26 +24,29 @@ def valid_deck():
     return Deck(name="Test Deck", leader=leader, cards=cards)
 
 
+@pytest.fixture(scope="module")
+def initial_game(valid_deck):
+    """Initialize a game once per module (shuffle, life cards, starting hands)."""
+    return initialize_game("Alice", "Bob", valid_deck, valid_deck)
+
+
 @pytest.fixture
-def game_with_characters(valid_deck):
+def game_with_characters(initial_game):
     """Create a game with characters on the field."""
-    game = initialize_game("Alice", "Bob", valid_deck, valid_deck)
+    # Deep copy so each test mutates its own game
+    game = copy.deepcopy(initial_game)
     
     # Add some characters to player1's field
     char1 = Character(name="Strong Char", cost=5, power=6000, counter=1000)
     char2 = Character(name="Weak Char", cost=2, power=2000, counter=1000)
-    game.player1.characters.append(char1)
-    game.player1.characters.append(char2)
-    game.player1.character_states[char1.id] = CardState.ACTIVE
-    game.player1.character_states[char2.id] = CardState.ACTIVE
+    game.player1.add_character(char1)
+    game.player1.add_character(char2)
     
     # Add characters to player2's field
     char3 = Character(name="Defender", cost=4, power=4000, counter=1000)
     char4 = Character(name="Rested Defender", cost=3, power=3000, counter=1000)
-    game.player2.characters.append(char3)
-    game.player2.characters.append(char4)
-    game.player2.character_states[char3.id] = CardState.ACTIVE
-    game.player2.character_states[char4.id] = CardState.RESTED
+    game.player2.add_character(char3)
+    game.player2.add_character(char4, CardState.RESTED)
     
     return game
 
@@ -223,8 +228,7 @@ class TestBattleResolution:
         
         # Create character with exactly 5000 power to match leader
         equal_char = Character(name="Equal", cost=5, power=5000, counter=1000)
-        game.player1.characters.append(equal_char)
-        game.player1.character_states[equal_char.id] = CardState.ACTIVE
+        game.player1.add_character(equal_char)
         
         battle = initiate_battle(game, equal_char.id, "leader", is_leader_attack=False)
         battle.phase = BattlePhase.RESOLVE
@@ -1,8 +1,10 @@
 """
 Tests for Card models.
 """
+import copy
 import pytest
 import json
+from dataclasses import FrozenInstanceError
 
 from src.models import Card, Leader, Character, Event, Stage, create_card_from_dict
 
@@ -28,6 +30,42 @@ class TestCard:
         card2 = Card(name="Card 1", card_type="Character", cost=1)
         assert card1.id != card2.id
     
+    def test_card_is_immutable(self):
+        """Test that cards cannot be modified after creation."""
+        card = Character(name="Zoro", cost=4, power=5000, counter=1000)
+        with pytest.raises(FrozenInstanceError):
+            card.name = "Sanji"
+    
+    def test_cards_use_slots(self):
+        """Test that no card type carries a per-instance __dict__."""
+        cards = [
+            Leader(name="Luffy", cost=0),
+            Character(name="Zoro", cost=4),
+            Event(name="Gum-Gum Pistol", cost=1),
+            Stage(name="Going Merry", cost=1),
+        ]
+        for card in cards:
+            assert not hasattr(card, "__dict__"), type(card).__name__
+    
+    def test_copies_share_the_card(self):
+        """Test that copying a card (or a list of cards) reuses it."""
+        card = Character(name="Zoro", cost=4)
+        assert copy.copy(card) is card
+        assert copy.deepcopy([card])[0] is card
+    
+    def test_card_names_are_interned(self):
+        """Test that cards with equal names share one name string."""
+        first = Character(name="".join(["Zo", "ro"]), cost=4)
+        second = Event(name="".join(["Zor", "o"]), cost=1)
+        assert first.name is second.name
+    
+    def test_card_is_hashable(self):
+        """Test that cards can be used as dictionary keys."""
+        card = Character(name="Zoro", cost=4, power=5000, counter=1000)
+        states = {card: "active"}
+        assert states[card] == "active"
+        assert hash(card) == hash(card.id)
+    
     def test_card_cost_validation(self):
         """Test that card cost must be between 0 and 10."""
         # Valid costs
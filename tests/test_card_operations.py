@@ -5,14 +5,15 @@ Tests saving, loading, searching, and deleting cards from SQLite.
 """
 
 import pytest
-import tempfile
-import os
+import sqlite3
+from dataclasses import replace
 from pathlib import Path
+from uuid import uuid4
 
 from src.models import Leader, Character, Event, Stage
-from src.db import init_database
 from src.db.card_operations import (
     save_card,
+    save_cards,
     get_card_by_id,
     get_card_by_name,
     get_all_cards,
@@ -21,67 +22,67 @@ from src.db.card_operations import (
     delete_card,
     get_card_count,
 )
+from src.db.connection import close_all, get_connection, get_connection_context, transaction
+from src.db.schema import get_schema
 
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    
-    # Initialize the database
-    init_database(path)
-    
-    yield path
-    
-    # Cleanup
-    if os.path.exists(path):
-        os.unlink(path)
+def temp_db(memory_db):
+    """Create a temporary (in-memory) database for testing."""
+    return memory_db
+
+
+# Cards are frozen, so one instance per module can be shared by every
+# test instead of being rebuilt (and re-validated) for each one
+_LEADER = Leader(
+    name="Monkey D. Luffy",
+    cost=0,
+    power=5000,
+    life=5,
+    effect_text="[Activate: Main] DON!! -1: This Leader gains +1000 power."
+)
+_CHARACTER = Character(
+    name="Roronoa Zoro",
+    cost=4,
+    power=5000,
+    counter=1000,
+    effect_text="[On Play] K.O. up to 1 opponent's character with 3000 power or less."
+)
+_EVENT = Event(
+    name="Gum-Gum Pistol",
+    cost=2,
+    counter=0,
+    effect_text="K.O. up to 1 opponent's character with 4000 power or less."
+)
+_STAGE = Stage(
+    name="Going Merry",
+    cost=3,
+    effect_text="All your {Red} Characters gain +1000 power."
+)
 
 
 @pytest.fixture
 def sample_leader():
-    """Create a sample leader card."""
-    return Leader(
-        name="Monkey D. Luffy",
-        cost=0,
-        power=5000,
-        life=5,
-        effect_text="[Activate: Main] DON!! -1: This Leader gains +1000 power."
-    )
+    """Sample leader card."""
+    return _LEADER
 
 
 @pytest.fixture
 def sample_character():
-    """Create a sample character card."""
-    return Character(
-        name="Roronoa Zoro",
-        cost=4,
-        power=5000,
-        counter=1000,
-        effect_text="[On Play] K.O. up to 1 opponent's character with 3000 power or less."
-    )
+    """Sample character card."""
+    return _CHARACTER
 
 
 @pytest.fixture
 def sample_event():
-    """Create a sample event card."""
-    return Event(
-        name="Gum-Gum Pistol",
-        cost=2,
-        counter=0,
-        effect_text="K.O. up to 1 opponent's character with 4000 power or less."
-    )
+    """Sample event card."""
+    return _EVENT
 
 
 @pytest.fixture
 def sample_stage():
-    """Create a sample stage card."""
-    return Stage(
-        name="Going Merry",
-        cost=3,
-        effect_text="All your {Red} Characters gain +1000 power."
-    )
+    """Sample stage card."""
+    return _STAGE
 
 
 class TestSaveCard:
@@ -108,12 +109,15 @@ class TestSaveCard:
         assert get_card_count(temp_db) == 1
     
     def test_save_multiple_cards(self, temp_db, sample_leader, sample_character, sample_event):
-        """Test saving multiple cards."""
-        save_card(sample_leader, temp_db)
-        save_card(sample_character, temp_db)
-        save_card(sample_event, temp_db)
+        """Test saving multiple cards in one batch."""
+        assert save_cards([sample_leader, sample_character, sample_event], temp_db) is True
         assert get_card_count(temp_db) == 3
     
+    def test_save_cards_empty(self, temp_db):
+        """Test that saving an empty batch succeeds and stores nothing."""
+        assert save_cards([], temp_db) is True
+        assert get_card_count(temp_db) == 0
+    
     def test_save_duplicate_id(self, temp_db, sample_character):
         """Test that saving a card with the same ID updates the existing card."""
         # Save once
@@ -121,8 +125,8 @@ class TestSaveCard:
         assert get_card_count(temp_db) == 1
         
         # Modify and save again (same ID)
-        sample_character.name = "Modified Name"
-        save_card(sample_character, temp_db)
+        modified = replace(sample_character, name="Modified Name")
+        save_card(modified, temp_db)
         
         # Should still be 1 card (updated, not duplicated)
         assert get_card_count(temp_db) == 1
@@ -145,6 +149,27 @@ class TestLoadCard:
         assert loaded.power == 5000
         assert loaded.counter == 1000
     
+    def test_loaded_cards_equal_saved(self, temp_db, sample_leader, sample_character,
+                                      sample_event, sample_stage):
+        """Test that every card type round-trips to an equal card."""
+        cards = [sample_leader, sample_character, sample_event, sample_stage]
+        save_cards(cards, temp_db)
+        
+        for card in cards:
+            loaded = get_card_by_id(card.id, temp_db)
+            assert loaded == card
+            assert type(loaded) is type(card)
+    
+    def test_get_card_unknown_type(self, temp_db):
+        """Test that a row with an unknown card type is not loaded."""
+        with get_connection_context(temp_db) as conn:
+            conn.execute(
+                "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)",
+                ("odd-card", "Odd Card", "Creature", "")
+            )
+        
+        assert get_card_by_id("odd-card", temp_db) is None
+    
     def test_get_card_by_id_not_found(self, temp_db):
         """Test loading a non-existent card returns None."""
         loaded = get_card_by_id("fake-id-123", temp_db)
@@ -168,9 +193,7 @@ class TestLoadCard:
     
     def test_get_all_cards(self, temp_db, sample_leader, sample_character, sample_event):
         """Test loading all cards."""
-        save_card(sample_leader, temp_db)
-        save_card(sample_character, temp_db)
-        save_card(sample_event, temp_db)
+        save_cards([sample_leader, sample_character, sample_event], temp_db)
         
         all_cards = get_all_cards(temp_db)
         assert len(all_cards) == 3
@@ -253,6 +276,46 @@ class TestSearchCards:
         
         results = search_cards("Kaido", temp_db)
         assert results == []
+    
+    def test_search_short_query(self, temp_db, sample_character):
+        """Test that queries too short for the full-text index still match."""
+        save_card(sample_character, temp_db)
+        
+        assert len(search_cards("ro", temp_db)) == 1
+        assert search_cards("qz", temp_db) == []
+    
+    def test_search_special_characters(self, temp_db, sample_character):
+        """Test that full-text query syntax in the search string is escaped."""
+        save_card(sample_character, temp_db)
+        
+        assert search_cards('Zoro" OR "Luffy', temp_db) == []
+        assert len(search_cards("Roronoa Zoro", temp_db)) == 1
+    
+    def test_search_after_update_and_delete(self, temp_db, sample_character):
+        """Test that the search index follows card updates and deletes."""
+        save_card(sample_character, temp_db)
+        save_card(replace(sample_character, name="Vinsmoke Sanji"), temp_db)
+        
+        assert search_cards("Zoro", temp_db) == []
+        assert len(search_cards("Sanji", temp_db)) == 1
+        
+        delete_card(sample_character.id, temp_db)
+        assert search_cards("Sanji", temp_db) == []
+    
+    def test_search_without_fts(self, monkeypatch, sample_character):
+        """Test that SQLite builds without trigram FTS fall back to LIKE search."""
+        monkeypatch.setattr("src.db.card_operations.FTS_TRIGRAM_SUPPORTED", False)
+        uri = f"file:nofts_{uuid4().hex}?mode=memory&cache=shared"
+        keeper = sqlite3.connect(uri, uri=True)
+        keeper.executescript(get_schema(include_fts=False))
+        try:
+            save_card(sample_character, uri)
+            
+            assert len(search_cards("oro", uri)) == 1
+            assert search_cards("Kaido", uri) == []
+        finally:
+            close_all()
+            keeper.close()
 
 
 class TestDeleteCard:
@@ -298,3 +361,49 @@ class TestCardCount:
         
         save_card(sample_event, temp_db)
         assert get_card_count(temp_db) == 3
+    
+    def test_card_count_after_updates_and_deletes(self, temp_db, sample_leader, sample_character):
+        """Test that the count stays correct when saves update existing cards."""
+        assert get_card_count(temp_db) == 0
+        
+        save_cards([sample_leader, sample_character, sample_leader], temp_db)
+        assert get_card_count(temp_db) == 2
+        
+        save_card(replace(sample_character, name="Renamed"), temp_db)
+        assert get_card_count(temp_db) == 2
+        
+        delete_card(sample_leader.id, temp_db)
+        delete_card(sample_leader.id, temp_db)
+        assert get_card_count(temp_db) == 1
+    
+    def test_card_count_sees_other_writers(self, temp_db, sample_leader):
+        """Test that the count notices rows written outside card_operations."""
+        assert get_card_count(temp_db) == 0
+        
+        conn = sqlite3.connect(temp_db, uri=True)
+        conn.execute(
+            "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)",
+            ("external-card", "External Card", "Stage", "")
+        )
+        conn.commit()
+        conn.close()
+        assert get_card_count(temp_db) == 1
+        
+        with get_connection_context(temp_db) as conn:
+            conn.execute("DELETE FROM cards")
+        assert get_card_count(temp_db) == 0
+    
+    def test_card_count_after_rollback(self, temp_db, sample_leader):
+        """Test that a rolled-back save is not counted."""
+        conn = get_connection(temp_db)
+        try:
+            with pytest.raises(RuntimeError):
+                with transaction(conn):
+                    save_card(sample_leader, conn)
+                    assert get_card_count(conn) == 1
+                    raise RuntimeError("abort")
+            
+            assert get_card_count(conn) == 0
+            assert conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0] == 0
+        finally:
+            conn.close()
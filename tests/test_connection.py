@@ -4,28 +4,38 @@ Tests for database connection management.
 import pytest
 import sqlite3
 from pathlib import Path
+import shutil
 import tempfile
+import threading
 import os
 
-from src.db.connection import get_connection, get_connection_context, verify_connection
-from src.db.schema import init_database
+from src.db.connection import (
+    get_connection,
+    get_connection_context,
+    get_closing_connection_context,
+    transaction,
+    close_all,
+    verify_connection,
+    _POOL_SIZE,
+)
 
 
 @pytest.fixture
-def initialized_db():
+def initialized_db(template_db):
     """Create and initialize a temporary database."""
     fd, path = tempfile.mkstemp(suffix=".db")
     os.close(fd)
     db_path = Path(path)
     
-    # Initialize the database with schema
-    init_database(db_path)
+    # Start from a copy of the pre-initialized template database
+    shutil.copyfile(template_db, db_path)
     
     yield db_path
     
-    # Cleanup
-    if db_path.exists():
-        db_path.unlink()
+    # Cleanup (release pooled connections first so the file can be removed)
+    close_all()
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
 
 
 def test_get_connection_creates_connection(initialized_db):
@@ -59,8 +69,8 @@ def test_connection_uses_row_factory(initialized_db):
 
 
 def test_connection_context_manager(initialized_db):
-    """Test the context manager for database connections."""
-    with get_connection_context(initialized_db) as conn:
+    """Test the closing context manager for database connections."""
+    with get_closing_connection_context(initialized_db) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) as count FROM cards")
         result = cursor.fetchone()
@@ -72,6 +82,92 @@ def test_connection_context_manager(initialized_db):
         cursor.execute("SELECT 1")
 
 
+def test_connection_context_reuses_connection(initialized_db):
+    """Test that get_connection_context reuses a pooled connection."""
+    with get_connection_context(initialized_db) as first:
+        pass
+    with get_connection_context(str(initialized_db)) as second:
+        pass
+    
+    assert first is second
+    
+    close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+
+
+def test_pool_eviction_spares_other_threads(initialized_db):
+    """Test that opening connections never closes one another thread is using."""
+    thread_count = _POOL_SIZE + 2
+    all_open = threading.Barrier(thread_count)
+    errors = []
+    
+    def worker():
+        try:
+            with get_connection_context(initialized_db) as conn:
+                conn.execute("SELECT COUNT(*) FROM cards").fetchone()
+                # Every thread holds its connection while the others open theirs
+                all_open.wait(timeout=10)
+                conn.execute("SELECT COUNT(*) FROM cards").fetchone()
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows cannot delete an open database file")
+def test_connection_context_reopens_replaced_file(initialized_db, template_db):
+    """Test that a pooled connection is dropped when its file is replaced."""
+    with get_connection_context(initialized_db) as first:
+        first.execute(
+            "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)",
+            ("stale-card", "Stale Card", "Creature", "Does nothing")
+        )
+    
+    # Replace the database, including the WAL files that belong to it
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{initialized_db}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(template_db, initialized_db)
+    
+    with get_connection_context(initialized_db) as second:
+        count = second.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+    
+    assert second is not first
+    assert count == 0
+
+
+def test_connection_context_accepts_uri(memory_db):
+    """Test that SQLite URIs (shared in-memory databases) are supported."""
+    with get_connection_context(memory_db) as conn:
+        conn.execute(
+            "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)",
+            ("uri-card", "URI Card", "Stage", "")
+        )
+    
+    with get_closing_connection_context(memory_db) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+    
+    assert count == 1
+    assert not Path(memory_db).exists()
+
+
+def test_connection_uses_wal_journal(initialized_db):
+    """Test that connections are configured for write-ahead logging."""
+    conn = get_connection(initialized_db)
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    conn.close()
+    
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
 def test_connection_context_commits_on_success(initialized_db):
     """Test that context manager commits changes on success."""
     # Insert a test card
@@ -117,6 +213,63 @@ def test_connection_context_rolls_back_on_error(initialized_db):
         assert result is None, "Transaction should have been rolled back"
 
 
+def test_transaction_rolls_back_on_error(initialized_db):
+    """Test that a transaction rolls back changes on error."""
+    test_card_id = "test-card-456"
+    conn = get_connection(initialized_db)
+    
+    try:
+        with transaction(conn):
+            conn.execute(
+                "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)",
+                (test_card_id, "Test Card", "Creature", "Does nothing")
+            )
+            # Force an error
+            raise ValueError("Intentional error")
+    except ValueError:
+        pass  # Expected error
+    
+    # Verify the card was NOT committed
+    result = conn.execute("SELECT * FROM cards WHERE id = ?", (test_card_id,)).fetchone()
+    in_transaction = conn.in_transaction
+    conn.close()
+    
+    assert result is None, "Transaction should have been rolled back"
+    assert not in_transaction
+
+
+def test_connection_context_restores_borrowed_row_factory(initialized_db):
+    """Test that a connection passed in gets its own row_factory back."""
+    conn = sqlite3.connect(initialized_db)
+    
+    try:
+        with get_connection_context(conn) as borrowed:
+            row = borrowed.execute("SELECT COUNT(*) as count FROM cards").fetchone()
+            assert row["count"] == 0
+        
+        assert conn.row_factory is None
+        assert conn.execute("SELECT COUNT(*) FROM cards").fetchone() == (0,)
+    finally:
+        conn.close()
+
+
+def test_nested_connection_context_rolls_back_inner_only(initialized_db):
+    """Test that a failing nested context keeps the outer context's changes."""
+    insert = "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)"
+    
+    with get_connection_context(initialized_db) as conn:
+        conn.execute(insert, ("outer-card", "Outer", "Creature", ""))
+        with pytest.raises(ValueError):
+            with get_connection_context(initialized_db) as inner:
+                inner.execute(insert, ("inner-card", "Inner", "Creature", ""))
+                raise ValueError("Intentional error")
+    
+    with get_closing_connection_context(initialized_db) as conn:
+        ids = [row["id"] for row in conn.execute("SELECT id FROM cards")]
+    
+    assert ids == ["outer-card"]
+
+
 def test_verify_connection_returns_true_for_valid_db(initialized_db):
     """Test that verify_connection returns True for valid database."""
     assert verify_connection(initialized_db) is True
@@ -29,9 +29,9 @@ def temp_db():
     
     yield db_path
     
-    # Cleanup: remove the temporary database
-    if db_path.exists():
-        db_path.unlink()
+    # Cleanup: remove the temporary database and any WAL files
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
 
 
 def test_database_initialization(temp_db):
@@ -59,6 +59,17 @@ def test_tables_created(temp_db):
         assert table in tables, f"Table '{table}' was not created"
 
 
+def test_database_uses_wal_journal(temp_db):
+    """Test that initialization leaves the database in WAL mode."""
+    init_database(temp_db)
+    
+    conn = sqlite3.connect(temp_db)
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    
+    assert journal_mode == "wal"
+
+
 def test_cards_table_structure(temp_db):
     """Test that the cards table has the correct columns."""
     init_database(temp_db)
@@ -115,6 +126,50 @@ def test_schema_is_valid_sql(temp_db):
     assert success, "Schema SQL contains syntax errors"
 
 
+def test_schema_statements_are_split(temp_db):
+    """Test that the pre-split schema statements are each complete SQL."""
+    from src.db.schema import _SCHEMA_STATEMENTS
+    
+    assert len(_SCHEMA_STATEMENTS) > 1
+    assert all(sqlite3.complete_statement(stmt) for stmt in _SCHEMA_STATEMENTS)
+    assert get_schema() is get_schema()  # Cached
+
+
+def test_card_type_name_index_created(temp_db):
+    """Test that get_cards_by_type() is served by the composite index."""
+    init_database(temp_db)
+    
+    conn = sqlite3.connect(temp_db)
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM cards WHERE card_type = ? ORDER BY name",
+        ("character",)
+    )
+    plan = " ".join(row[3] for row in cursor.fetchall())
+    conn.close()
+    
+    assert "idx_cards_type_name" in plan
+    assert "TEMP B-TREE" not in plan, "ORDER BY name should not need a sort"
+
+
+def test_deck_card_count_uses_covering_index(temp_db):
+    """Test that get_deck_card_count() reads only the covering index."""
+    init_database(temp_db)
+    
+    conn = sqlite3.connect(temp_db)
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT SUM(quantity) FROM deck_cards WHERE deck_id = ?",
+        ("deck-1",)
+    )
+    plan = " ".join(row[3] for row in cursor.fetchall())
+    conn.close()
+    
+    assert "COVERING INDEX idx_deck_cards_deck_id_qty" in plan
+
+
 def test_schema_version_table_created(temp_db):
     """Test that schema_version table is created during initialization."""
     init_database(temp_db)
@@ -153,6 +208,44 @@ def test_get_schema_version_returns_current_version(temp_db):
     assert version == CURRENT_SCHEMA_VERSION
 
 
+def test_upgrade_indexes_existing_rows(temp_db):
+    """Test that upgrading a v1 database makes its existing cards and decks searchable."""
+    from src.db import close_all
+    from src.db.card_operations import save_card, search_cards
+    from src.db.deck_operations import save_deck, search_decks
+    from src.models import Character, Deck
+    
+    migration = Path(__file__).parent.parent / "src" / "db" / "migrations" / "001_initial_schema.sql"
+    conn = sqlite3.connect(temp_db)
+    conn.executescript(migration.read_text())
+    conn.close()
+    card = Character(name="Roronoa Zoro", cost=4, power=5000, counter=1000)
+    deck = Deck(name="Red Luffy Aggro", description="Rush down the opponent")
+    
+    try:
+        save_card(card, temp_db)
+        save_deck(deck, temp_db)
+        init_database(temp_db)
+        
+        assert get_schema_version(temp_db) == CURRENT_SCHEMA_VERSION
+        assert [c.id for c in search_cards("Zoro", temp_db)] == [card.id]
+        assert [d.id for d in search_decks("Aggro", temp_db)] == [deck.id]
+    finally:
+        close_all()
+
+
+def test_init_database_with_memory_uri():
+    """Test initializing a shared in-memory database given as a URI."""
+    uri = "file:test_init_database?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)  # Keeps the memory database alive
+    
+    try:
+        init_database(uri)
+        assert get_schema_version(uri) == CURRENT_SCHEMA_VERSION
+    finally:
+        keeper.close()
+
+
 def test_get_schema_version_returns_zero_for_nonexistent_db():
     """Test that get_schema_version returns 0 for non-existent database."""
     fake_path = Path("/nonexistent/database.db")
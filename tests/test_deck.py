@@ -7,26 +7,31 @@ import json
 from src.models import Deck, Leader, Character, Event, Stage
 
 
+# Cards are frozen, so one instance per module can be shared by every test
+_LEADER = Leader(
+    name="Monkey D. Luffy",
+    cost=0,
+    power=5000,
+    life=5,
+)
+_CHARACTER = Character(
+    name="Roronoa Zoro",
+    cost=4,
+    power=5000,
+    counter=1000,
+)
+
+
 @pytest.fixture
 def sample_leader():
-    """Create a sample leader for testing."""
-    return Leader(
-        name="Monkey D. Luffy",
-        cost=0,
-        power=5000,
-        life=5,
-    )
+    """Sample leader for testing."""
+    return _LEADER
 
 
 @pytest.fixture
 def sample_character():
-    """Create a sample character for testing."""
-    return Character(
-        name="Roronoa Zoro",
-        cost=4,
-        power=5000,
-        counter=1000,
-    )
+    """Sample character for testing."""
+    return _CHARACTER
 
 
 class TestDeckCreation:
@@ -107,6 +112,30 @@ class TestDeckCardManagement:
         with pytest.raises(ValueError, match="Cannot add more than 4 copies"):
             deck.add_card(fifth_card)
     
+    def test_add_cards(self, sample_character):
+        """Test adding a batch of cards."""
+        deck = Deck(name="Test Deck")
+        deck.add_card(sample_character)
+        deck.add_cards([
+            Character(name="Roronoa Zoro", cost=4, power=5000, counter=1000)
+            for _ in range(3)
+        ])
+        assert len(deck) == 4
+    
+    def test_add_cards_rejects_whole_batch(self, sample_character, sample_leader):
+        """Test that a batch breaking deck rules adds nothing."""
+        deck = Deck(name="Test Deck")
+        deck.add_card(sample_character)
+        
+        with pytest.raises(ValueError, match="more than 4 copies"):
+            deck.add_cards([
+                Character(name="Roronoa Zoro", cost=4, power=5000, counter=1000)
+                for _ in range(4)
+            ])
+        with pytest.raises(ValueError, match="Cannot add leader"):
+            deck.add_cards([sample_leader])
+        assert len(deck) == 1
+    
     def test_remove_card(self, sample_character):
         """Test removing a card from the deck."""
         deck = Deck(name="Test Deck")
@@ -116,6 +145,19 @@ class TestDeckCardManagement:
         assert result is True
         assert len(deck) == 0
     
+    def test_remove_card_keeps_order(self):
+        """Test removing cards by ID from the middle of the deck."""
+        deck = Deck(name="Test Deck")
+        cards = [Character(name=f"Char {i}", cost=1, power=1000, counter=1000) for i in range(5)]
+        deck.add_cards(cards)
+        deck.cards.append(cards[0])
+        
+        assert deck.remove_card(cards[1].id) is True
+        assert deck.remove_card(cards[3].id) is True
+        assert deck.remove_card(cards[0].id) is True
+        assert deck.remove_card(cards[3].id) is False
+        assert deck.cards == [cards[2], cards[4], cards[0]]
+    
     def test_remove_nonexistent_card(self):
         """Test removing a card that doesn't exist."""
         deck = Deck(name="Test Deck")
@@ -173,15 +215,18 @@ class TestDeckValidation:
         deck.set_leader(sample_leader)
         
         # Add exactly 50 cards with proper limits
-        for i in range(13):  # 13 different cards
-            for j in range(3):  # 3 copies each = 39 cards
-                card = Character(name=f"Character {i}", cost=1, power=1000, counter=1000)
-                deck.add_card(card)
+        # 13 different cards, 3 copies each = 39 cards
+        deck.add_cards([
+            Character(name=f"Character {i}", cost=1, power=1000, counter=1000)
+            for i in range(13)
+            for j in range(3)
+        ])
         
         # Add 11 more unique cards to reach 50
-        for i in range(11):
-            card = Character(name=f"Unique {i}", cost=1, power=1000, counter=1000)
-            deck.add_card(card)
+        deck.add_cards([
+            Character(name=f"Unique {i}", cost=1, power=1000, counter=1000)
+            for i in range(11)
+        ])
         
         valid, errors = deck.is_valid()
         assert valid is True
@@ -195,18 +240,44 @@ class TestDeckUtilities:
         """Test getting card counts in the deck."""
         deck = Deck(name="Test Deck")
         
-        # Add 3 copies of Zoro
-        for i in range(3):
-            deck.add_card(Character(name="Zoro", cost=4, power=5000, counter=1000))
-        
-        # Add 2 copies of Nami
-        for i in range(2):
-            deck.add_card(Character(name="Nami", cost=2, power=3000, counter=2000))
+        # Add 3 copies of Zoro and 2 copies of Nami
+        deck.add_cards(
+            [Character(name="Zoro", cost=4, power=5000, counter=1000) for _ in range(3)]
+            + [Character(name="Nami", cost=2, power=3000, counter=2000) for _ in range(2)]
+        )
         
         counts = deck.get_card_counts()
         assert counts["Zoro"] == 3
         assert counts["Nami"] == 2
     
+    def test_card_counts_follow_changes(self):
+        """Test that card counts track adds, removes and direct list changes."""
+        zoro = Character(name="Zoro", cost=4, power=5000, counter=1000)
+        nami = Character(name="Nami", cost=2, power=3000, counter=2000)
+        deck = Deck(name="Test Deck", cards=[zoro, zoro])
+        
+        deck.add_card(nami)
+        assert deck.get_card_counts() == {"Zoro": 2, "Nami": 1}
+        
+        deck.remove_card(nami.id)
+        assert deck.get_card_counts() == {"Zoro": 2}
+        
+        deck.cards.append(nami)  # Direct list access bypasses add_card()
+        assert deck.get_card_counts() == {"Zoro": 2, "Nami": 1}
+        
+        deck.cards[-1] = zoro  # Same length, different card
+        assert deck.get_card_counts() == {"Zoro": 3}
+        
+        deck.add_card(zoro)
+        with pytest.raises(ValueError):
+            deck.add_card(zoro)
+        
+        deck.cards.append(nami)
+        deck.cards[-1] = zoro  # A fifth Zoro, swapped in place
+        valid, errors = deck.is_valid()
+        assert not valid
+        assert "'Zoro' has 5 copies (max 4 allowed)" in errors
+    
     def test_deck_to_dict(self, sample_leader, sample_character):
         """Test converting deck to dictionary."""
         deck = Deck(name="Test Deck", description="A test deck")
@@ -232,6 +303,17 @@ class TestDeckUtilities:
         assert data["name"] == "Test Deck"
         assert data["leader"]["name"] == "Monkey D. Luffy"
     
+    def test_deck_to_json_without_orjson(self, sample_leader, monkeypatch):
+        """Test that to_json falls back to the json module."""
+        import src.models.deck as deck_module
+        
+        deck = Deck(name="Test Deck")
+        deck.set_leader(sample_leader)
+        expected = deck.to_json()
+        
+        monkeypatch.setattr(deck_module, "orjson", None)
+        assert json.loads(deck.to_json()) == json.loads(expected)
+    
     def test_deck_from_dict(self):
         """Test creating deck from dictionary."""
         data = {
@@ -4,18 +4,19 @@ Tests for deck database operations.
 Tests saving, loading, searching, and deleting decks from SQLite.
 """
 
+import copy
+
 import pytest
-import tempfile
-import os
 
 from src.models import Deck, Leader, Character, Event, Stage
-from src.db import init_database
-from src.db.card_operations import save_card
+from src.db.connection import get_connection
+from src.db.card_operations import save_cards
 from src.db.deck_operations import (
     save_deck,
     get_deck_by_id,
     get_deck_by_name,
     get_all_decks,
+    get_all_decks_with_counts,
     get_deck_card_count,
     delete_deck,
     search_decks,
@@ -24,24 +25,21 @@ from src.db.deck_operations import (
 
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    
-    # Initialize the database
-    init_database(path)
-    
-    yield path
-    
-    # Cleanup
-    if os.path.exists(path):
-        os.unlink(path)
+def temp_db(memory_db):
+    """
+    Open one connection to a temporary (in-memory) database.
+    
+    Every operation in a test runs on this connection instead of looking
+    one up by path for each call.
+    """
+    conn = get_connection(memory_db)
+    yield conn
+    conn.close()
 
 
-@pytest.fixture
-def sample_deck(temp_db):
-    """Create a sample deck with cards."""
+@pytest.fixture(scope="session")
+def sample_deck_template():
+    """Build the sample deck once; tests get copies via sample_deck."""
     # Create leader
     leader = Leader(name="Luffy", cost=0, power=5000, life=5)
     
@@ -54,22 +52,23 @@ def sample_deck(temp_db):
     nami = Character(name="Nami", cost=2, power=3000, counter=2000)
     event = Event(name="Pistol", cost=2, counter=0)
     
-    # Save cards to database first
-    save_card(zoro, temp_db)
-    save_card(nami, temp_db)
-    save_card(event, temp_db)
-    
-    # Add cards to deck
-    for _ in range(4):  # 4 copies of Zoro
-        deck.add_card(zoro)
-    for _ in range(4):  # 4 copies of Nami
-        deck.add_card(nami)
-    for _ in range(3):  # 3 copies of Pistol
-        deck.add_card(event)
+    # Add cards to deck: 4 copies of Zoro, 4 of Nami, 3 of Pistol
+    deck.add_cards([zoro] * 4 + [nami] * 4 + [event] * 3)
     
     return deck
 
 
+@pytest.fixture
+def sample_deck(temp_db, sample_deck_template):
+    """Create a sample deck with cards."""
+    # Save cards to database first (one transaction)
+    save_cards(list(dict.fromkeys(sample_deck_template.cards)), temp_db)
+    
+    # Tests may modify the deck, so each gets its own copy
+    # (cards are immutable and shared with the template)
+    return copy.deepcopy(sample_deck_template)
+
+
 class TestSaveDeck:
     """Tests for saving decks to the database."""
     
@@ -119,6 +118,19 @@ class TestSaveDeck:
         assert get_deck_count(temp_db) == 1
         loaded = get_deck_by_id(sample_deck.id, temp_db)
         assert loaded.name == "Modified Name"
+    
+    def test_save_deck_with_many_distinct_cards(self, temp_db):
+        """Test saving more distinct cards than fit in one INSERT."""
+        cards = [
+            Character(name=f"Char {i}", cost=1, power=1000, counter=1000)
+            for i in range(400)
+        ]
+        save_cards(cards, temp_db)
+        deck = Deck(name="Pile")
+        deck.add_cards(cards)
+        
+        assert save_deck(deck, temp_db) is True
+        assert get_deck_card_count(deck.id, temp_db) == 400
 
 
 class TestLoadDeck:
@@ -214,6 +226,19 @@ class TestDeckCardCount:
         """Test card count for non-existent deck."""
         count = get_deck_card_count("fake-id", temp_db)
         assert count == 0
+    
+    def test_get_all_decks_with_counts(self, temp_db, sample_deck):
+        """Test listing every deck with its card count in one call."""
+        save_deck(sample_deck, temp_db)
+        save_deck(Deck(name="Empty"), temp_db)
+        
+        results = get_all_decks_with_counts(temp_db)
+        
+        assert [(deck.name, count) for deck, count in results] == [
+            ("Empty", 0),
+            ("Red Aggro", 11),
+        ]
+        assert all(len(deck.cards) == 0 for deck, _ in results)
 
 
 class TestSearchDecks:
@@ -262,6 +287,18 @@ class TestSearchDecks:
         
         results = search_decks("Purple", temp_db)
         assert results == []
+    
+    def test_search_after_rename_and_delete(self, temp_db, sample_deck):
+        """Test that the search index follows deck updates and deletes."""
+        save_deck(sample_deck, temp_db)
+        sample_deck.name = "Green Ramp"
+        save_deck(sample_deck, temp_db)
+        
+        assert search_decks("Aggro", temp_db) == []
+        assert len(search_decks("Ramp", temp_db)) == 1
+        
+        delete_deck(sample_deck.id, temp_db)
+        assert search_decks("Ramp", temp_db) == []
 
 
 class TestDeleteDeck:
@@ -155,3 +155,11 @@ class TestBoardEvaluator:
         
         # Player 1 lost
         assert score < -9000
+    
+    def test_score_winner(self, sample_leader):
+        """Scoring a known winner matches get_terminal_score; no winner is a draw."""
+        winner = PlayerState(player_id="1", name="Player 1", leader=sample_leader)
+        
+        assert BoardEvaluator.score_winner(winner, "1") > 9000
+        assert BoardEvaluator.score_winner(winner, "2") < -9000
+        assert BoardEvaluator.score_winner(None, "1") == 0.0
@@ -4,27 +4,32 @@ Tests for game initialization.
 Tests setting up new games, shuffling, dealing, and mulligans.
 """
 
+import random
+
+import numpy as np
 import pytest
 
 from src.engine import initialize_game, get_game_summary, mulligan
 from src.models import Deck, Leader, Character, Event
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_deck():
-    """Create a valid 50-card deck for testing."""
+    """
+    Create a valid 50-card deck for testing.
+    
+    Built once per session: initialize_game() copies the cards into
+    player state and never modifies the deck itself.
+    """
     leader = Leader(name="Luffy", cost=0, power=5000, life=5)
     deck = Deck(name="Test Deck")
     deck.set_leader(leader)
     
     # Add 50 cards (mix of characters and events)
-    for i in range(40):
-        char = Character(name=f"Character {i}", cost=2, power=3000, counter=1000)
-        deck.add_card(char)
-    
-    for i in range(10):
-        event = Event(name=f"Event {i}", cost=1, counter=0)
-        deck.add_card(event)
+    deck.add_cards(
+        [Character(name=f"Character {i}", cost=2, power=3000, counter=1000) for i in range(40)]
+        + [Event(name=f"Event {i}", cost=1, counter=0) for i in range(10)]
+    )
     
     return deck
 
@@ -127,6 +132,21 @@ class TestGameInitialization:
         # At least one card should be different
         # (technically could fail with ~0.000000001% chance)
         assert hand1_names != hand2_names
+    
+    def test_seeded_shuffles_are_reproducible(self, valid_deck):
+        """Test that random.seed() or an explicit rng reproduces the deal."""
+        def deal(**kwargs):
+            game = initialize_game("Alice", "Bob", valid_deck, valid_deck, **kwargs)
+            mulligan(game.player1, kwargs.get("rng"))
+            return [c.name for c in game.player1.hand + game.player1.deck + game.player2.hand]
+        
+        random.seed(42)
+        first = deal()
+        random.seed(42)
+        assert deal() == first
+        random.seed()  # Don't leave later tests on a fixed seed
+        
+        assert deal(rng=np.random.default_rng(7)) == deal(rng=np.random.default_rng(7))
 
 
 class TestMulligan:
@@ -168,6 +168,49 @@ class TestGameInitialization:
         
         assert len(game.action_history) == 1
         assert game.action_history[0] == action
+    
+    def test_action_history_limit(self, sample_leader, initialized_game_state):
+        """Test that history_len keeps only the most recent actions."""
+        config = GameConfig(
+            player1_deck=[],
+            player2_deck=[],
+            player1_leader=sample_leader,
+            player2_leader=sample_leader,
+            history_len=1
+        )
+        
+        game = Game(config, MockPlayer([]), MockPlayer([]))
+        game.state = initialized_game_state
+        actions = [
+            PassPhaseAction(player_id="1", action_type=ActionType.PASS_PHASE)
+            for _ in range(2)
+        ]
+        
+        assert game.run_scripted(actions) == 2
+        assert len(game.action_history) == 1
+        assert game.action_history[0] is actions[1]
+    
+    def test_run_scripted(self, sample_leader, initialized_game_state):
+        """Test replaying a fixed action sequence without players."""
+        config = GameConfig(
+            player1_deck=[],
+            player2_deck=[],
+            player1_leader=sample_leader,
+            player2_leader=sample_leader
+        )
+        
+        game = Game(config, MockPlayer([]), MockPlayer([]))
+        game.state = initialized_game_state
+        actions = [
+            PassPhaseAction(player_id="1", action_type=ActionType.PASS_PHASE),
+            AttachDonAction(player_id="1", action_type=ActionType.ATTACH_DON,
+                            target_id="leader", don_count=99),
+            PassPhaseAction(player_id="1", action_type=ActionType.PASS_PHASE),
+        ]
+        
+        # The oversized DON!! attachment fails and stops the replay
+        assert game.run_scripted(actions) == 1
+        assert list(game.action_history) == actions[:1]
 
 
 class TestWinConditions:
@@ -292,6 +335,33 @@ class TestActionExecution:
         assert test_char.id in game.state.player1.played_this_turn
         assert game.state.player1.character_states[test_char.id] == CardState.ACTIVE
     
+    def test_play_card_without_enough_don_keeps_hand(self, initialized_game_state):
+        """Test that a failed play leaves the hand exactly as it was."""
+        game = Game(
+            GameConfig([], [], initialized_game_state.player1.leader,
+                      initialized_game_state.player2.leader),
+            MockPlayer([]),
+            MockPlayer([])
+        )
+        game.state = initialized_game_state
+        
+        test_char = Character(name="Test Char", cost=3, power=4000, counter=1000)
+        other_char = Character(name="Other Char", cost=1, power=2000, counter=1000)
+        game.state.player1.hand[:0] = [test_char, other_char]
+        hand_before = list(game.state.player1.hand)
+        game.state.player1.active_don = 2
+        
+        action = PlayCardAction(
+            player_id="1",
+            card=test_char,
+            don_to_rest=3,
+            action_type=ActionType.PLAY_CARD
+        )
+        
+        assert game._execute_play_card(action) is False
+        assert game.state.player1.hand == hand_before
+        assert game.state.player1.active_don == 2
+    
     def test_execute_play_event(self, initialized_game_state, sample_event):
         """Test playing an event card (goes to trash)."""
         game = Game(
@@ -96,7 +96,19 @@ class TestPlayerState:
             player1.characters.append(char)
         
         assert player1.is_field_full()
-    
+
+    def test_add_character(self, player1):
+        """Test placing characters on the field with their state."""
+        char1 = Character(name="Char1", cost=2, power=3000, counter=1000)
+        char2 = Character(name="Char2", cost=3, power=4000, counter=1000)
+
+        player1.add_character(char1)
+        player1.add_character(char2, CardState.RESTED)
+
+        assert player1.characters == [char1, char2]
+        assert player1.character_states[char1.id] == CardState.ACTIVE
+        assert player1.character_states[char2.id] == CardState.RESTED
+
     def test_get_total_power(self, player1):
         """Test calculating total power."""
         # Leader power only
@@ -119,6 +131,35 @@ class TestPlayerState:
         
         assert player1.get_total_power() == 10000  # 5000 + 3000 + 2000
     
+    def test_find_character(self, player1):
+        """Test looking up a field character by id."""
+        char = Character(name="Char", cost=2, power=3000, counter=1000)
+        player1.add_character(char)
+        
+        assert player1.find_character(char.id) is char
+        assert player1.find_character("missing") is None
+    
+    def test_find_in_hand(self, player1):
+        """Test looking up a hand card by id."""
+        char = Character(name="Char", cost=2, power=3000, counter=1000)
+        player1.hand.append(char)
+        
+        assert player1.find_in_hand(char.id) is char
+        assert player1.find_in_hand("missing") is None
+    
+    def test_attach_don(self, player1):
+        """Test moving DON!! from the active pool onto cards."""
+        char = Character(name="Char", cost=2, power=3000, counter=1000)
+        player1.add_character(char)
+        player1.active_don = 4
+        
+        player1.attach_don(char.id, 2)
+        player1.attach_don(char.id)
+        player1.attach_don("leader")
+        
+        assert player1.active_don == 0
+        assert player1.attached_don == {char.id: 3, "leader": 1}
+    
     def test_player_state_to_dict(self, player1):
         """Test serializing player state to dict."""
         data = player1.to_dict()
@@ -243,6 +284,31 @@ class TestGameState:
         assert data["is_game_over"] is False
         assert data["winner"] is None
     
+    def test_states_use_slots(self, game_state):
+        """Test that game and player states carry no per-instance __dict__."""
+        assert not hasattr(game_state, "__dict__")
+        assert not hasattr(game_state.player1, "__dict__")
+    
+    def test_clone(self, game_state):
+        """Test that clones share cards but not zones."""
+        char = Character(name="Char", cost=2, power=3000, counter=1000)
+        game_state.player1.add_character(char)
+        game_state.player1.attached_don[char.id] = 1
+        
+        clone = game_state.clone()
+        assert clone == game_state
+        assert clone.canonical_key() == game_state.canonical_key()
+        
+        clone.player1.deck.pop()
+        clone.player1.character_states[char.id] = CardState.RESTED
+        clone.player1.attached_don.clear()
+        assert clone.canonical_key() != game_state.canonical_key()
+        
+        assert len(game_state.player1.deck) == 10
+        assert game_state.player1.character_states[char.id] == CardState.ACTIVE
+        assert game_state.player1.attached_don == {char.id: 1}
+        assert clone.player1.characters[0] is char
+    
     def test_game_state_to_json(self, game_state):
         """Test serializing game state to JSON."""
         json_str = game_state.to_json()
@@ -14,10 +14,9 @@ from src.engine.actions import (
 from src.ai.minimax_ai import MinimaxAI
 
 
-@pytest.fixture
-def simple_game_state():
-    """Create a simple game state for testing."""
-    # Leaders
+@pytest.fixture(scope="module")
+def leaders():
+    """Create both leaders once per module (cards are immutable, so tests can share them)."""
     leader1 = Leader(
         name="Test Leader 1",
         cost=0,
@@ -32,6 +31,13 @@ def simple_game_state():
         life=5,
         effect_text=""
     )
+    return leader1, leader2
+
+
+@pytest.fixture
+def simple_game_state(leaders):
+    """Create a simple game state for testing."""
+    leader1, leader2 = leaders
     
     # Create player states
     player1 = PlayerState(
@@ -274,8 +280,25 @@ def test_simulate_pass_phase(simple_game_state):
     assert new_state is not None
     assert new_state.current_phase != initial_phase  # Phase advanced
     
-    # Verify original state unchanged
+    # Verify original state unchanged and not shared
     assert simple_game_state.current_phase == initial_phase
+    assert new_state.player1 is not simple_game_state.player1
+    assert new_state.player2 is not simple_game_state.player2
+
+
+def test_simulate_pass_phase_at_end(simple_game_state):
+    """Test that passing END refreshes the next player on a copy only."""
+    ai = MinimaxAI(player_id="P1")
+    simple_game_state.current_phase = Phase.END
+    simple_game_state.player2.don_deck = ["DON"] * 10
+    
+    action = PassPhaseAction(player_id="P1", action_type=ActionType.PASS_PHASE)
+    new_state = ai._simulate_action(simple_game_state, action)
+    
+    assert new_state.active_player_id == "P2"
+    assert new_state.player2.don_pool == 2
+    assert simple_game_state.player2.don_pool == 0
+    assert len(simple_game_state.player2.don_deck) == 10
 
 
 def test_simulate_invalid_action_returns_none(simple_game_state):
@@ -306,7 +329,7 @@ def test_simulate_invalid_action_returns_none(simple_game_state):
 
 
 def test_deep_copy_isolation(simple_game_state):
-    """Test that simulation properly isolates states via deep copy."""
+    """Test that simulation properly isolates states via cloning."""
     ai = MinimaxAI(player_id="P1")
     
     # Add character to hand
@@ -337,3 +360,26 @@ def test_deep_copy_isolation(simple_game_state):
     assert simple_game_state.player1.active_don == 5
     assert char in simple_game_state.player1.hand
     assert len(simple_game_state.player1.characters) == 0
+
+
+def test_transposition_table(simple_game_state, monkeypatch):
+    """Test that transposed positions are reused without changing the result."""
+    state = simple_game_state
+    for player in (state.player1, state.player2):
+        player.deck = [Character(name=f"Deck {i}", cost=1, power=1000) for i in range(10)]
+        player.life_cards = player.deck[:5]
+    # Attacking with these in either order reaches the same position
+    for i in range(3):
+        state.player1.add_character(
+            Character(name=f"Attacker {i}", cost=3, power=6000, counter=1000)
+        )
+    
+    ai = MinimaxAI(player_id="P1", max_depth=3)
+    best = ai.get_action(state.clone())
+    assert ai.tt_hits > 0
+    
+    # Same choice with the table disabled (every entry evicted at once)
+    monkeypatch.setattr("src.ai.minimax_ai._TT_SIZE", 0)
+    plain = MinimaxAI(player_id="P1", max_depth=3)
+    assert plain.get_action(state.clone()) == best
+    assert plain.tt_hits == 0
@@ -0,0 +1,108 @@
+"""
+Tests for the read-query result cache.
+"""
+import pytest
+import sqlite3
+
+from src.models import Character, Stage
+from src.db import save_card, get_all_cards, get_cards_by_type, search_cards
+from src.db.connection import get_connection_context, _get_pooled_connection
+from src.db.query_cache import clear_query_cache
+
+
+@pytest.fixture
+def temp_db(memory_db):
+    """Create a temporary (in-memory) database for testing."""
+    yield memory_db
+    clear_query_cache()
+
+
+@pytest.fixture
+def zoro():
+    """Create a sample character for testing."""
+    return Character(name="Roronoa Zoro", cost=4, power=5000, counter=1000)
+
+
+def _count_card_queries(db_path):
+    """Record the cards SELECTs run on the pooled connection for db_path."""
+    statements = []
+    conn = _get_pooled_connection(db_path)
+    conn.set_trace_callback(
+        lambda sql: statements.append(sql) if "FROM cards" in sql else None
+    )
+    return statements
+
+
+def test_repeated_reads_hit_cache(temp_db, zoro):
+    """Test that an unchanged database is not queried again."""
+    save_card(zoro, temp_db)
+    first = get_all_cards(temp_db)
+    
+    statements = _count_card_queries(temp_db)
+    second = get_all_cards(temp_db)
+    
+    assert second == first
+    assert statements == []
+
+
+def test_cache_keyed_by_arguments(temp_db, zoro):
+    """Test that different query arguments are cached separately."""
+    save_card(zoro, temp_db)
+    save_card(Stage(name="Going Merry", cost=1), temp_db)
+    
+    assert [c.name for c in get_cards_by_type("Character", temp_db)] == ["Roronoa Zoro"]
+    assert [c.name for c in get_cards_by_type("Stage", temp_db)] == ["Going Merry"]
+    assert len(search_cards("Zoro", temp_db)) == 1
+    assert search_cards("Merry", temp_db)[0].name == "Going Merry"
+
+
+def test_writes_invalidate_cache(temp_db, zoro):
+    """Test that writes from any connection invalidate cached results."""
+    assert get_all_cards(temp_db) == []
+    
+    save_card(zoro, temp_db)
+    assert len(get_all_cards(temp_db)) == 1
+    
+    with get_connection_context(temp_db) as conn:
+        conn.execute("DELETE FROM cards")
+    assert get_all_cards(temp_db) == []
+    
+    conn = sqlite3.connect(temp_db, uri=True)
+    conn.execute(
+        "INSERT INTO cards (id, name, card_type, rules_text) VALUES (?, ?, ?, ?)",
+        ("external-card", "External Card", "Stage", "")
+    )
+    conn.commit()
+    conn.close()
+    assert len(get_all_cards(temp_db)) == 1
+
+
+def test_rollback_invalidates_cache(temp_db, zoro):
+    """Test that rows read before a rollback are not served afterwards."""
+    with pytest.raises(RuntimeError):
+        with get_connection_context(temp_db):
+            save_card(zoro, temp_db)
+            assert len(get_all_cards(temp_db)) == 1
+            raise RuntimeError("abort")
+    
+    assert get_all_cards(temp_db) == []
+
+
+def test_cached_result_is_a_copy(temp_db, zoro):
+    """Test that mutating a returned list does not change the cache."""
+    save_card(zoro, temp_db)
+    get_all_cards(temp_db).clear()
+    
+    assert len(get_all_cards(temp_db)) == 1
+
+
+def test_cache_can_be_disabled(temp_db, zoro, monkeypatch):
+    """Test that DECKHAND_NO_QCACHE bypasses the cache."""
+    monkeypatch.setenv("DECKHAND_NO_QCACHE", "1")
+    save_card(zoro, temp_db)
+    get_all_cards(temp_db)
+    
+    statements = _count_card_queries(temp_db)
+    get_all_cards(temp_db)
+    
+    assert len(statements) == 1
@@ -5,13 +5,15 @@ Verifies that RandomAI correctly implements the Player protocol and
 makes valid decisions during gameplay.
 """
 
+from dataclasses import dataclass
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from src.ai.random_ai import RandomAI
-from src.engine.game_state import GameState, Phase
+from src.engine.game_state import Phase
 from src.engine.actions import (
-    Action, ActionType, PlayCardAction, AttackAction, PassPhaseAction
+    ActionType, PlayCardAction, AttackAction
 )
 from src.models import Leader, Character
 
@@ -38,14 +40,34 @@ def sample_character():
     )
 
 
+@pytest.fixture
+def play_action(sample_character):
+    """Create a real play-card action (cheaper than a Mock(spec=...))."""
+    return PlayCardAction(
+        player_id="1",
+        card=sample_character,
+        don_to_rest=2,
+        action_type=ActionType.PLAY_CARD
+    )
+
+
+@dataclass
+class FakeGameState:
+    """
+    Minimal stand-in for GameState.
+    
+    RandomAI only reads these fields here (get_legal_actions is patched),
+    and a plain dataclass is much cheaper to build than Mock(spec=GameState).
+    """
+    current_phase: Phase = Phase.MAIN
+    active_player_id: str = "1"
+    turn_number: int = 1
+
+
 @pytest.fixture
 def mock_game_state():
-    """Create a mock game state for testing."""
-    state = Mock(spec=GameState)
-    state.current_phase = Phase.MAIN
-    state.active_player_id = "1"
-    state.turn_number = 1
-    return state
+    """Create a fake game state for testing."""
+    return FakeGameState()
 
 
 class TestRandomAIInitialization:
@@ -65,6 +87,21 @@ class TestRandomAIInitialization:
         assert ai.player_id == "2"
         assert ai.action_probability == 0.9
     
+    def test_seeded_ai_is_reproducible(self, mock_game_state, sample_character):
+        """AIs with the same seed make the same choices."""
+        actions = [
+            PlayCardAction(player_id="1", card=sample_character, don_to_rest=i,
+                           action_type=ActionType.PLAY_CARD)
+            for i in range(5)
+        ]
+        choices = []
+        for _ in range(2):
+            ai = RandomAI(player_id="1", seed=42)
+            with patch('src.ai.random_ai.get_legal_actions', return_value=actions):
+                choices.append([ai.get_action(mock_game_state) for _ in range(10)])
+        
+        assert choices[0] == choices[1]
+    
     def test_ai_repr(self):
         """Test AI string representation."""
         ai = RandomAI(player_id="1", action_probability=0.8)
@@ -97,34 +134,25 @@ class TestRandomAIDecisionMaking:
     
     @patch('src.ai.random_ai.get_legal_actions')
     @patch('random.random')
-    def test_chooses_action_when_available(self, mock_random, mock_get_legal, mock_game_state):
+    def test_chooses_action_when_available(self, mock_random, mock_get_legal, mock_game_state, play_action):
         """AI should choose from available actions."""
         ai = RandomAI(player_id="1")
         
-        # Create mock actions
-        mock_action = Mock(spec=Action)
-        mock_action.action_type = ActionType.PLAY_CARD
-        mock_action.player_id = "1"
-        
-        mock_get_legal.return_value = [mock_action]
+        mock_get_legal.return_value = [play_action]
         mock_random.return_value = 0.5  # Will trigger action (< 0.7)
         
         action = ai.get_action(mock_game_state)
         
-        assert action == mock_action
+        assert action == play_action
         assert ai.actions_this_turn == 1
     
     @patch('src.ai.random_ai.get_legal_actions')
     @patch('random.random')
-    def test_can_choose_to_pass(self, mock_random, mock_get_legal, mock_game_state):
+    def test_can_choose_to_pass(self, mock_random, mock_get_legal, mock_game_state, play_action):
         """AI should sometimes randomly choose to pass."""
         ai = RandomAI(player_id="1")
         
-        # Create mock actions
-        mock_action = Mock(spec=Action)
-        mock_action.action_type = ActionType.PLAY_CARD
-        
-        mock_get_legal.return_value = [mock_action]
+        mock_get_legal.return_value = [play_action]
         mock_random.return_value = 0.9  # Will trigger pass (> 0.7)
         
         action = ai.get_action(mock_game_state)
@@ -133,28 +161,21 @@ class TestRandomAIDecisionMaking:
         assert action.player_id == "1"
     
     @patch('src.ai.random_ai.get_legal_actions')
-    def test_filters_out_pass_actions_from_choices(self, mock_get_legal, mock_game_state):
+    def test_filters_out_pass_actions_from_choices(self, mock_get_legal, mock_game_state, play_action):
         """AI should not randomly select pass from legal actions list."""
         ai = RandomAI(player_id="1")
         
-        # Create mix of actions including pass
-        play_action = Mock(spec=PlayCardAction)
-        play_action.action_type = ActionType.PLAY_CARD
+        mock_get_legal.return_value = [play_action]
         
-        pass_action = Mock(spec=PassPhaseAction)
-        pass_action.action_type = ActionType.PASS_PHASE
-        
-        mock_get_legal.return_value = [play_action, pass_action]
-        
-        # Run multiple times to ensure pass is filtered
         with patch('random.random', return_value=0.5):  # Trigger action
             with patch('random.choice') as mock_choice:
                 ai.get_action(mock_game_state)
                 
-                # Should only choose from non-pass actions
-                call_args = mock_choice.call_args[0][0]
-                assert play_action in call_args
-                assert pass_action not in call_args
+                # Pass is left out of the legal moves the AI picks from
+                mock_get_legal.assert_called_once_with(
+                    mock_game_state, "1", include_pass=False
+                )
+                assert mock_choice.call_args[0][0] == [play_action]
 
 
 class TestRandomAIStateManagement:
@@ -182,13 +203,11 @@ class TestRandomAIStateManagement:
     
     @patch('src.ai.random_ai.get_legal_actions')
     @patch('random.random')
-    def test_action_probability_decreases_with_actions(self, mock_random, mock_get_legal, mock_game_state):
+    def test_action_probability_decreases_with_actions(self, mock_random, mock_get_legal, mock_game_state, play_action):
         """AI should become more likely to pass after taking multiple actions."""
         ai = RandomAI(player_id="1", action_probability=0.7)
         
-        mock_action = Mock(spec=Action)
-        mock_action.action_type = ActionType.PLAY_CARD
-        mock_get_legal.return_value = [mock_action]
+        mock_get_legal.return_value = [play_action]
         
         # First action: probability = 0.7 / (1 + 0 * 0.2) = 0.7
         ai.actions_this_turn = 0
@@ -206,19 +225,34 @@ class TestRandomAIStateManagement:
 class TestRandomAIBehaviorPatterns:
     """Tests for RandomAI realistic behavior."""
     
+    @patch('src.ai.random_ai.get_legal_actions')
+    @patch('random.random')
+    def test_changed_probability_applies(self, mock_random, mock_get_legal, mock_game_state, play_action):
+        """Changing action_probability after creation affects later decisions."""
+        ai = RandomAI(player_id="1", action_probability=0.7)
+        ai.action_probability = 0.1
+        
+        mock_get_legal.return_value = [play_action]
+        mock_random.return_value = 0.5
+        
+        action = ai.get_action(mock_game_state)
+        
+        assert action.action_type == ActionType.PASS_PHASE
+    
     @patch('src.ai.random_ai.get_legal_actions')
     @patch('random.choice')
     @patch('random.random')
-    def test_selects_from_multiple_actions(self, mock_random, mock_choice, mock_get_legal, mock_game_state):
+    def test_selects_from_multiple_actions(self, mock_random, mock_choice, mock_get_legal, mock_game_state, play_action):
         """AI should be able to select from multiple action types."""
         ai = RandomAI(player_id="1")
         
         # Create different action types
-        play_action = Mock(spec=PlayCardAction)
-        play_action.action_type = ActionType.PLAY_CARD
-        
-        attack_action = Mock(spec=AttackAction)
-        attack_action.action_type = ActionType.ATTACK
+        attack_action = AttackAction(
+            player_id="1",
+            attacker_id="attacker",
+            target_id="leader",
+            action_type=ActionType.ATTACK
+        )
         
         mock_get_legal.return_value = [play_action, attack_action]
         mock_random.return_value = 0.5  # Trigger action
@@ -251,5 +285,5 @@ class TestRandomAIBehaviorPatterns:
             action = ai.get_action(mock_game_state)
             
             # Should call get_legal_actions with correct player_id
-            mock_get_legal.assert_called_once_with(mock_game_state, "2")
+            mock_get_legal.assert_called_once_with(mock_game_state, "2", include_pass=False)
             assert action.player_id == "2"
@@ -16,17 +16,22 @@ from src.engine import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_deck():
-    """Create a valid 50-card deck for testing."""
+    """
+    Create a valid 50-card deck for testing.
+    
+    Built once per session: initialize_game() copies the cards into
+    player state and never modifies the deck itself.
+    """
     leader = Leader(name="Luffy", cost=0, power=5000, life=5)
     cards = [Character(name=f"Char{i}", cost=2, power=3000, counter=1000) for i in range(50)]
     return Deck(name="Test Deck", leader=leader, cards=cards)
 
 
-@pytest.fixture
-def game_for_validation(valid_deck):
-    """Create a game state for validation testing."""
+@pytest.fixture(scope="module")
+def validation_template(valid_deck):
+    """Set up the validation game once per module (see game_for_validation)."""
     game = initialize_game("Alice", "Bob", valid_deck, valid_deck)
     
     # Clear starting hand and replace with test cards
@@ -60,6 +65,17 @@ def game_for_validation(valid_deck):
     return game
 
 
+@pytest.fixture
+def game_for_validation(validation_template):
+    """
+    Create a game state for validation testing.
+    
+    Each test gets its own clone of the module template, so tests can
+    change phases, zones and DON!! freely without re-initializing.
+    """
+    return validation_template.clone()
+
+
 class TestPlayCardValidation:
     """Test validation for playing cards from hand."""
     
@@ -410,6 +426,17 @@ class TestGetLegalActions:
         attack_actions = [a for a in actions if a.action_type == ActionType.ATTACK]
         assert len(attack_actions) > 0  # Can attack leader at minimum
     
+    def test_get_legal_actions_without_pass(self, game_for_validation):
+        """Test leaving the pass action out of the legal actions."""
+        game = game_for_validation
+        game.current_phase = Phase.MAIN
+        
+        with_pass = get_legal_actions(game, game.player1.player_id)
+        actions = get_legal_actions(game, game.player1.player_id, include_pass=False)
+        
+        assert len(actions) == len(with_pass) - 1
+        assert all(a.action_type != ActionType.PASS_PHASE for a in actions)
+    
     def test_get_legal_actions_don_phase(self, game_for_validation):
         """Test that legal actions are generated in DON phase."""
         game = game_for_validation
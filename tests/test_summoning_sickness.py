@@ -56,6 +56,18 @@ def game_for_sickness():
     return game
 
 
+def attack_leader(game, player, attacker_id, is_leader_attack=False):
+    """Validate an attack on the opponent's leader by one of player's cards."""
+    action = AttackAction(
+        player_id=player.player_id,
+        attacker_id=attacker_id,
+        target_id="leader",
+        is_leader_attack=is_leader_attack,
+        action_type=ActionType.ATTACK
+    )
+    return validate_action(game, action)
+
+
 class TestSummoningSickness:
     """Tests for summoning sickness mechanics."""
     
@@ -68,15 +80,7 @@ class TestSummoningSickness:
         assert player.first_turn is True
         
         char = player.characters[0]
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=char.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, char.id)
         assert is_valid is False
         assert "first turn" in error.lower()
     
@@ -88,15 +92,7 @@ class TestSummoningSickness:
         # Player1 is on their first turn
         assert player.first_turn is True
         
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=player.leader.id,
-            target_id="leader",
-            is_leader_attack=True,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, player.leader.id, is_leader_attack=True)
         assert is_valid is False
         assert "first turn" in error.lower()
     
@@ -109,15 +105,7 @@ class TestSummoningSickness:
         player.first_turn = False
         
         char = player.characters[0]
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=char.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, char.id)
         assert is_valid is True
     
     def test_cannot_attack_when_played_this_turn(self, game_for_sickness):
@@ -130,15 +118,7 @@ class TestSummoningSickness:
         char = player.characters[0]
         player.played_this_turn.add(char.id)
         
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=char.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, char.id)
         assert is_valid is False
         assert "summoning sickness" in error.lower()
     
@@ -153,15 +133,7 @@ class TestSummoningSickness:
         char2 = player.characters[1]
         player.played_this_turn.add(char2.id)  # Different character
         
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=char1.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, char1.id)
         assert is_valid is True
     
     def test_refresh_clears_summoning_sickness(self, game_for_sickness):
@@ -212,15 +184,7 @@ class TestSummoningSickness:
         # Switch to player2's turn
         game.active_player_id = player2.player_id
         
-        action = AttackAction(
-            player_id=player2.player_id,
-            attacker_id=char.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player2, char.id)
         assert is_valid is False
         assert "first turn" in error.lower()
     
@@ -238,28 +202,12 @@ class TestSummoningSickness:
         player.played_this_turn.add(char2.id)
         
         # Try to attack with char1
-        action1 = AttackAction(
-            player_id=player.player_id,
-            attacker_id=char1.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid1, error1 = validate_action(game, action1)
+        is_valid1, error1 = attack_leader(game, player, char1.id)
         assert is_valid1 is False
         assert "summoning sickness" in error1.lower()
         
         # Try to attack with char2
-        action2 = AttackAction(
-            player_id=player.player_id,
-            attacker_id=char2.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid2, error2 = validate_action(game, action2)
+        is_valid2, error2 = attack_leader(game, player, char2.id)
         assert is_valid2 is False
         assert "summoning sickness" in error2.lower()
     
@@ -277,15 +225,7 @@ class TestSummoningSickness:
         player.character_states[rush_char.id] = CardState.ACTIVE
         player.played_this_turn.add(rush_char.id)
         
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=rush_char.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, rush_char.id)
         assert is_valid is True  # Rush allows immediate attack
     
     def test_rush_still_blocked_on_first_turn(self, game_for_sickness):
@@ -301,14 +241,6 @@ class TestSummoningSickness:
         player.characters.append(rush_char)
         player.character_states[rush_char.id] = CardState.ACTIVE
         
-        action = AttackAction(
-            player_id=player.player_id,
-            attacker_id=rush_char.id,
-            target_id="leader",
-            is_leader_attack=False,
-            action_type=ActionType.ATTACK
-        )
-        
-        is_valid, error = validate_action(game, action)
+        is_valid, error = attack_leader(game, player, rush_char.id)
         assert is_valid is False  # First turn restriction applies even with Rush
         assert "first turn" in error.lower()